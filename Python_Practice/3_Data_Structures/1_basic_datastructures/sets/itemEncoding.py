@@ -0,0 +1,45 @@
+'''
+Created on 18 Oct 2026
+
+@author: czarn
+
+Canonical bytes of an item, for hashes that have to agree between
+processes: BloomFilter and dictionaries/hyperLogLog.HyperLogLog.
+'''
+import struct
+
+_LENGTH = struct.Struct("<I")
+_FLOAT = struct.Struct("<d")
+
+
+def item_bytes(item):
+    ''' canonical bytes of item, the same in every process and for equal items
+        (1, 1.0 and True give the same bytes, like they are one item of a Set):
+        str -> utf-8, bytes as they are, integral numbers as their int, other
+        floats as IEEE doubles, None, and tuples/frozensets of these.
+        Anything else raises TypeError: its repr() may hold a memory address
+        or depend on the hash seed, which would make a filter miss it.
+    '''
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, float):
+        if not item.is_integer():
+            return b"f" + _FLOAT.pack(item)
+        item = int(item)
+    if isinstance(item, int):
+        return b"i" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return b"b" + bytes(item)
+    if item is None:
+        return b"n"
+    if isinstance(item, tuple):
+        parts = [item_bytes(part) for part in item]
+        tag = b"t"
+    elif isinstance(item, frozenset):
+        # Sorted, so the order the set happens to iterate in does not matter.
+        parts = sorted(item_bytes(part) for part in item)
+        tag = b"z"
+    else:
+        raise TypeError("cannot hash items of type {} the same way in every process"
+                        .format(type(item).__name__))
+    return tag + b"".join(_LENGTH.pack(len(part)) + part for part in parts)
@@ -0,0 +1,91 @@
+'''
+Created on 18 Oct 2026
+
+@author: czarn
+
+Memory and speed of RoaringBitmap against Set (dict based) and the built-in
+set, on ids that are sparse in some ranges and dense in others: scattered
+random ids, a block where most ids are taken, and long unbroken runs.
+'''
+import random
+import sys
+import tracemalloc
+from timeit import default_timer as timer
+
+from roaringBitmap import RoaringBitmap
+from setImplementation import Set
+
+
+def mixed_ids(n, seed):
+    rnd = random.Random(seed)
+    ids = set(rnd.randrange(1 << 32) for _ in range(n // 10))                 # sparse
+    ids.update(x for x in range(1 << 24, (1 << 24) + n) if rnd.random() < 0.6)  # dense
+    for _ in range(3):                                                        # runs
+        start = rnd.randrange(1 << 30, 1 << 31)
+        ids.update(range(start, start + n // 10))
+    return list(ids)
+
+
+def build(kind, ids):
+    if kind is set:
+        return set(ids)
+    if kind is Set:
+        return Set(*ids)
+    bitmap = RoaringBitmap()
+    bitmap.update(ids)
+    bitmap.run_optimize()
+    return bitmap
+
+
+def measure(kind, ids):
+    tracemalloc.start()
+    start = timer()
+    result = build(kind, ids)
+    elapsed = timer() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def best_of(fn, rounds=3):
+    times = []
+    for _ in range(rounds):
+        start = timer()
+        fn()
+        times.append(timer() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    # Optional argument: roughly how many ids per set, e.g. "python roaringBenchmark.py 200000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+
+    a_ids, b_ids = mixed_ids(n, 1), mixed_ids(n, 2)
+    probes = random.Random(3).sample(a_ids, 100000)
+    print("{} and {} ids".format(len(a_ids), len(b_ids)))
+    print("{:>14} {:>10} {:>13} {:>10} {:>10} {:>10}".format(
+        "", "build s", "bytes/id", "lookup us", "union s", "inter s"))
+
+    for name, kind in (("set", set), ("Set", Set), ("RoaringBitmap", RoaringBitmap)):
+        a, build_time, size = measure(kind, a_ids)
+        b = build(kind, b_ids)
+
+        if kind is set:
+            contains = a.__contains__
+            union, intersection = lambda: a | b, lambda: a & b
+        else:
+            contains = a.contains_item
+            union, intersection = lambda: a.union(b), lambda: a.intersection(b)
+
+        start = timer()
+        for x in probes:
+            contains(x)
+        lookup = (timer() - start) / len(probes)
+
+        print("{:>14} {:>10.2f} {:>13.2f} {:>10.3f} {:>10.3f} {:>10.3f}".format(
+            name, build_time, size / len(a_ids), lookup * 1e6,
+            best_of(union), best_of(intersection)))
+
+        if kind is RoaringBitmap:
+            print("serialized: {} bytes, {:.2f} bytes/id".format(
+                len(a.serialize()), len(a.serialize()) / len(a_ids)))
@@ -0,0 +1,501 @@
+'''
+Created on 18 Oct 2026
+
+@author: czarn
+'''
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from bitSet import _BITS
+
+ARRAY_MAX = 4096            # Above this many values a sorted array is bigger than a bitmap.
+BITMAP_BYTES = 8192         # 2**16 bits.
+
+_ARRAY, _BITMAP, _RUN = 0, 1, 2
+
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+def _le_bytes(values):
+    # Serialized arrays are little-endian whatever the machine is.
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _le_array(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _set_bits(data):
+    # Positions of the set bits in a little-endian byte string, in order.
+    # The regex skips the zero bytes in C, which matters for sparse chunks.
+    bits = _BITS
+    for match in _NONZERO.finditer(data):
+        index = match.start()
+        base = index * 8
+        for bit in bits[data[index]]:
+            yield base + bit
+
+
+def _int_bits(value):
+    # Positions of the set bits of a sparse int, lowest first.
+    while value:
+        lowest = value & -value
+        yield lowest.bit_length() - 1
+        value ^= lowest
+
+
+class _ArrayContainer:
+    """
+        Up to ARRAY_MAX sorted 16-bit values, 2 bytes each.
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else array("H")
+
+    @property
+    def cardinality(self):
+        return len(self.values)
+
+    def contains(self, low):
+        i = bisect_left(self.values, low)
+        return i < len(self.values) and self.values[i] == low
+
+    def add(self, low):
+        i = bisect_left(self.values, low)
+        if i < len(self.values) and self.values[i] == low:
+            return False
+        self.values.insert(i, low)
+        return True
+
+    def remove(self, low):
+        i = bisect_left(self.values, low)
+        if i < len(self.values) and self.values[i] == low:
+            del self.values[i]
+            return True
+        return False
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def to_int(self):
+        data = bytearray(BITMAP_BYTES)
+        for low in self.values:
+            data[low >> 3] |= 1 << (low & 7)
+        return int.from_bytes(data, "little")
+
+
+class _BitmapContainer:
+    """
+        2**16 bits in 8 KB, for chunks with many values.
+    """
+    __slots__ = ("bits", "cardinality")
+
+    def __init__(self, bits=None, cardinality=0):
+        self.bits = bits if bits is not None else bytearray(BITMAP_BYTES)
+        self.cardinality = cardinality
+
+    def contains(self, low):
+        return bool(self.bits[low >> 3] >> (low & 7) & 1)
+
+    def add(self, low):
+        mask = 1 << (low & 7)
+        if self.bits[low >> 3] & mask:
+            return False
+        self.bits[low >> 3] |= mask
+        self.cardinality += 1
+        return True
+
+    def remove(self, low):
+        mask = 1 << (low & 7)
+        if not self.bits[low >> 3] & mask:
+            return False
+        self.bits[low >> 3] &= ~mask & 0xFF
+        self.cardinality -= 1
+        return True
+
+    def __iter__(self):
+        return _set_bits(self.bits)
+
+    def to_int(self):
+        return int.from_bytes(self.bits, "little")
+
+
+class _RunContainer:
+    """
+        Sorted runs of consecutive values, 4 bytes per run: starts[i] and
+        lengths[i] (run length - 1, so a full chunk still fits in 16 bits).
+        Read-only: RoaringBitmap turns it into an array or bitmap before changing it.
+    """
+    __slots__ = ("starts", "lengths", "cardinality")
+
+    def __init__(self, starts, lengths):
+        self.starts = starts
+        self.lengths = lengths
+        self.cardinality = sum(lengths) + len(lengths)
+
+    def contains(self, low):
+        i = bisect_right(self.starts, low) - 1
+        return i >= 0 and low <= self.starts[i] + self.lengths[i]
+
+    def __iter__(self):
+        for start, length in zip(self.starts, self.lengths):
+            yield from range(start, start + length + 1)
+
+    def to_int(self):
+        value = 0
+        for start, length in zip(self.starts, self.lengths):
+            value |= ((1 << (length + 1)) - 1) << start
+        return value
+
+
+def _container_from_int(value, allow_runs=True):
+    """
+        Smallest container holding the set bits of value (a 2**16 bit int), None if empty.
+    """
+    cardinality = value.bit_count()
+    if cardinality == 0:
+        return None
+
+    starts = value & ~(value << 1)
+    runs = starts.bit_count()
+    if allow_runs and 4 * runs < min(2 * cardinality, BITMAP_BYTES):
+        ends = value & ~(value >> 1)
+        run_starts = array("H", _int_bits(starts))
+        run_lengths = array("H", (end - start for start, end in zip(run_starts, _int_bits(ends))))
+        return _RunContainer(run_starts, run_lengths)
+
+    data = value.to_bytes(BITMAP_BYTES, "little")
+    if cardinality <= ARRAY_MAX:
+        return _ArrayContainer(array("H", _set_bits(data)))
+    return _BitmapContainer(bytearray(data), cardinality)
+
+
+def _mutable(container):
+    if isinstance(container, _RunContainer):
+        return _container_from_int(container.to_int(), allow_runs=False)
+    return container
+
+
+class RoaringBitmap:
+    """
+        Compressed set of 32-bit unsigned integers (Roaring bitmap).
+        A value is split into its high 16 bits, which pick a chunk, and its
+        low 16 bits, stored in that chunk's container. Each chunk uses
+        whatever is smallest for its contents: a sorted array for sparse
+        chunks, a 8 KB bitmap for dense ones, or a list of runs (after
+        run_optimize() or a set operation) for long stretches of
+        consecutive values. Set operations work chunk by chunk and pick
+        the cheapest way for each pair of container types.
+    """
+
+    def __init__(self, *args):
+        self._keys = array("H")         #Sorted high 16 bits of the chunks in use.
+        self._containers = []           #Container of each chunk, same order as _keys.
+        self._cardinality = 0
+
+        for arg in args:
+            self.add_item(arg)
+
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        result = cls()
+        for key, container in chunks:
+            if container is not None:
+                result._keys.append(key)
+                result._containers.append(container)
+                result._cardinality += container.cardinality
+        return result
+
+
+    def __iter__(self):
+        for key, container in zip(self._keys, self._containers):
+            base = key << 16
+            for low in container:
+                yield base | low
+
+
+    def __len__(self):
+        return self._cardinality
+
+
+    def __contains__(self, item):
+        return self.contains_item(item)
+
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
+
+
+    def _check_value(self, item):
+        if not 0 <= item < 1 << 32:
+            raise ValueError("RoaringBitmap holds 32-bit unsigned integers, got {}".format(item))
+
+
+    def add_item(self, item):
+        self._check_value(item)
+        key, low = item >> 16, item & 0xFFFF
+
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            self._keys.insert(i, key)
+            self._containers.insert(i, _ArrayContainer())
+
+        container = _mutable(self._containers[i])
+        if container.add(low):
+            self._cardinality += 1
+            if isinstance(container, _ArrayContainer) and container.cardinality > ARRAY_MAX:
+                container = _container_from_int(container.to_int(), allow_runs=False)
+        self._containers[i] = container
+
+
+    def update(self, items):
+        """
+            Add many values at once: each chunk is built in one go and the
+            chunk list is sorted once at the end.
+        """
+        chunks = {}
+        for item in items:
+            self._check_value(item)
+            chunks.setdefault(item >> 16, []).append(item & 0xFFFF)
+
+        merged = dict(zip(self._keys, self._containers))
+        for key, lows in chunks.items():
+            old = merged.get(key)
+            if old is not None:
+                self._cardinality -= old.cardinality
+            container = merged[key] = _add_many(old, lows)
+            self._cardinality += container.cardinality
+
+        keys = sorted(merged)
+        self._keys = array("H", keys)
+        self._containers = [merged[key] for key in keys]
+
+
+    def remove_item(self, item):
+        key, low = item >> 16, item & 0xFFFF
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            raise KeyError(item)
+
+        container = _mutable(self._containers[i])
+        if not container.remove(low):
+            raise KeyError(item)
+        self._cardinality -= 1
+
+        if container.cardinality == 0:
+            del self._keys[i]
+            del self._containers[i]
+        elif isinstance(container, _BitmapContainer) and container.cardinality <= ARRAY_MAX:
+            self._containers[i] = _container_from_int(container.to_int(), allow_runs=False)
+        else:
+            self._containers[i] = container
+
+
+    def contains_item(self, item):
+        if not 0 <= item < 1 << 32:
+            return False
+        key = item >> 16
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key and self._containers[i].contains(item & 0xFFFF)
+
+
+    def items(self):
+        return iter(self)
+
+
+    def run_optimize(self):
+        """
+            Re-pick every container, allowing run containers where they are smaller.
+        """
+        for i, container in enumerate(self._containers):
+            if isinstance(container, _ArrayContainer):
+                # Count the runs straight from the array, most sparse chunks stay as they are.
+                values = container.values
+                runs = 1 + sum(1 for x, y in zip(values, values[1:]) if y != x + 1)
+                if 4 * runs >= 2 * len(values):
+                    continue
+            self._containers[i] = _container_from_int(container.to_int())
+
+
+    def _check(self, other_set):
+        if type(other_set) != type(self):
+            raise TypeError("other_set is not of type {}".format(type(self)))
+
+
+    def union(self, other_set):
+        self._check(other_set)
+        chunks = []
+        i = j = 0
+        while i < len(self._keys) or j < len(other_set._keys):
+            if j == len(other_set._keys) or (i < len(self._keys) and self._keys[i] < other_set._keys[j]):
+                chunks.append((self._keys[i], self._containers[i]))
+                i += 1
+            elif i == len(self._keys) or other_set._keys[j] < self._keys[i]:
+                chunks.append((other_set._keys[j], other_set._containers[j]))
+                j += 1
+            else:
+                chunks.append((self._keys[i], _union(self._containers[i], other_set._containers[j])))
+                i += 1
+                j += 1
+        # Containers taken over unchanged are shared, so copy the result before mutating it.
+        return self._from_chunks((key, _copy(container)) for key, container in chunks)
+
+
+    def intersection(self, other_set):
+        self._check(other_set)
+        chunks = []
+        i = j = 0
+        while i < len(self._keys) and j < len(other_set._keys):
+            if self._keys[i] < other_set._keys[j]:
+                i += 1
+            elif other_set._keys[j] < self._keys[i]:
+                j += 1
+            else:
+                chunks.append((self._keys[i], _intersection(self._containers[i], other_set._containers[j])))
+                i += 1
+                j += 1
+        return self._from_chunks(chunks)
+
+
+    def difference(self, other_set):
+        self._check(other_set)
+        chunks = []
+        j = 0
+        for key, container in zip(self._keys, self._containers):
+            while j < len(other_set._keys) and other_set._keys[j] < key:
+                j += 1
+            if j < len(other_set._keys) and other_set._keys[j] == key:
+                chunks.append((key, _container_from_int(container.to_int() & ~other_set._containers[j].to_int())))
+            else:
+                chunks.append((key, _copy(container)))
+        return self._from_chunks(chunks)
+
+
+    def serialize(self):
+        """
+            Bytes with every chunk: key, container type, count and payload, all little-endian.
+        """
+        parts = [b"RBM1", struct.pack("<I", len(self._keys))]
+        for key, container in zip(self._keys, self._containers):
+            if isinstance(container, _ArrayContainer):
+                payload = _le_bytes(container.values)
+                kind = _ARRAY
+            elif isinstance(container, _BitmapContainer):
+                payload = bytes(container.bits)
+                kind = _BITMAP
+            else:
+                payload = _le_bytes(container.starts) + _le_bytes(container.lengths)
+                kind = _RUN
+            parts.append(struct.pack("<HBI", key, kind, len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
+
+
+    @classmethod
+    def deserialize(cls, data):
+        if data[:4] != b"RBM1":
+            raise ValueError("not a serialized RoaringBitmap")
+
+        (count,) = struct.unpack_from("<I", data, 4)
+        offset = 8
+        chunks = []
+        for _ in range(count):
+            key, kind, size = struct.unpack_from("<HBI", data, offset)
+            offset += struct.calcsize("<HBI")
+            payload = data[offset:offset + size]
+            offset += size
+
+            if kind == _ARRAY:
+                container = _ArrayContainer(_le_array("H", payload))
+            elif kind == _BITMAP:
+                bits = bytearray(payload)
+                container = _BitmapContainer(bits, int.from_bytes(bits, "little").bit_count())
+            else:
+                half = size // 2
+                container = _RunContainer(_le_array("H", payload[:half]), _le_array("H", payload[half:]))
+            chunks.append((key, container))
+        return cls._from_chunks(chunks)
+
+
+def _copy(container):
+    if isinstance(container, _ArrayContainer):
+        return _ArrayContainer(array("H", container.values))
+    if isinstance(container, _BitmapContainer):
+        return _BitmapContainer(bytearray(container.bits), container.cardinality)
+    return container        # Run containers are never changed in place.
+
+
+def _add_many(container, lows):
+    """
+        New container with the values of container (None for an empty chunk) and lows.
+    """
+    if isinstance(container, _RunContainer):
+        # Goes back to the smallest of array and bitmap, like add_item does.
+        data = bytearray(BITMAP_BYTES)
+        for low in lows:
+            data[low >> 3] |= 1 << (low & 7)
+        return _container_from_int(container.to_int() | int.from_bytes(data, "little"), allow_runs=False)
+
+    if container is None or isinstance(container, _ArrayContainer):
+        values = set(lows)
+        if container is not None:
+            values.update(container.values)
+        if len(values) <= ARRAY_MAX:
+            return _ArrayContainer(array("H", sorted(values)))
+        data = bytearray(BITMAP_BYTES)
+        lows = values
+    else:
+        data = bytearray(container.to_int().to_bytes(BITMAP_BYTES, "little"))
+
+    for low in lows:
+        data[low >> 3] |= 1 << (low & 7)
+    return _BitmapContainer(data, int.from_bytes(data, "little").bit_count())
+
+
+def _union(a, b):
+    if isinstance(a, _ArrayContainer) and isinstance(b, _ArrayContainer) \
+            and a.cardinality + b.cardinality <= ARRAY_MAX:
+        return _ArrayContainer(array("H", sorted(set(a.values).union(b.values))))
+    return _container_from_int(a.to_int() | b.to_int())
+
+
+def _intersection(a, b):
+    if isinstance(b, _ArrayContainer) and not isinstance(a, _ArrayContainer):
+        a, b = b, a
+    if isinstance(a, _ArrayContainer):
+        # Probe the small array against the other container.
+        if isinstance(b, _ArrayContainer):
+            values = sorted(set(a.values).intersection(b.values))
+        else:
+            values = [low for low in a.values if b.contains(low)]
+        return _ArrayContainer(array("H", values)) if values else None
+    return _container_from_int(a.to_int() & b.to_int())
+
+
+if __name__ == "__main__":
+    s = RoaringBitmap(1, 2, 3, 70000, 70001)
+    s.update(range(200000, 300000))
+
+    print(len(s), 70000 in s, 150000 in s)
+
+    p = RoaringBitmap()
+    p.update(range(250000, 260000))
+    p.add_item(3)
+
+    print(len(s.union(p)), list(s.intersection(p))[:3], len(s.difference(p)))
+
+    s.run_optimize()
+    data = s.serialize()
+    print(len(data), "bytes serialized", list(RoaringBitmap.deserialize(data)) == list(s))
@@ -41,34 +41,136 @@ class Set:
         return self._data.keys()
 
 
-    def union(self, other_set):
+    def __contains__(self, item):
+        return item in self._data
+
+
+    def _check(self, other_set):
         if type(other_set) != type(self):
             raise TypeError("other_set is not of type {}".format(type(self)))
 
-        result = Set()
 
-        for item in self:
-            result.add_item(item)
+    def union(self, other_set):
+        self._check(other_set)
 
-        for item in other_set:
-            result.add_item(item)
+        # Copy the bigger dict in one go and add the smaller one to it.
+        big, small = (self, other_set) if len(self) >= len(other_set) else (other_set, self)
+        result = Set()
+        result._data = dict(big._data)
+        result._data.update(small._data)
 
         return result
 
 
     def intersection(self, other_set):
-        if type(other_set) != type(self):
-            raise TypeError("other_set is not of type {}".format(type(self)))
+        self._check(other_set)
 
+        # Walk the smaller set and look its items up in the bigger one.
+        big, small = (self, other_set) if len(self) >= len(other_set) else (other_set, self)
         result = Set()
+        result._data = {item: item for item in small._data if item in big._data}
+
+        return result
+
+
+    def difference(self, other_set):
+        self._check(other_set)
+
+        result = Set()
+        if len(other_set) < len(self):
+            result._data = dict(self._data)
+            for item in other_set._data:
+                result._data.pop(item, None)
+        else:
+            result._data = {item: item for item in self._data if item not in other_set._data}
+
+        return result
+
+
+    def symmetric_difference(self, other_set):
+        self._check(other_set)
+
+        result = self.union(other_set)
+        for item in self.intersection(other_set):
+            del result._data[item]
+
+        return result
+
+
+    def update(self, other_set):
+        self._check(other_set)
+        self._data.update(other_set._data)
+        return self
+
 
-        for item in self:
-            if item in other_set:
-                result.add_item(item)
+    def intersection_update(self, other_set):
+        self._check(other_set)
+        self._data = self.intersection(other_set)._data
+        return self
 
+
+    @classmethod
+    def intersect_all(cls, *sets):
+        """
+            Items found in every one of sets. The sets are taken from the
+            smallest up, so the candidates shrink as fast as possible, and
+            the work stops as soon as nothing is left.
+        """
+        result = cls()
+        if not sets:
+            return result
+
+        for other_set in sets:
+            result._check(other_set)
+
+        ordered = sorted(sets, key=len)
+        candidates = list(ordered[0]._data)
+        for other_set in ordered[1:]:
+            if not candidates:
+                break
+            data = other_set._data
+            candidates = [item for item in candidates if item in data]
+
+        result._data = {item: item for item in candidates}
         return result
 
 
+    def __or__(self, other_set):
+        if type(other_set) != type(self):
+            return NotImplemented
+        return self.union(other_set)
+
+
+    def __and__(self, other_set):
+        if type(other_set) != type(self):
+            return NotImplemented
+        return self.intersection(other_set)
+
+
+    def __sub__(self, other_set):
+        if type(other_set) != type(self):
+            return NotImplemented
+        return self.difference(other_set)
+
+
+    def __xor__(self, other_set):
+        if type(other_set) != type(self):
+            return NotImplemented
+        return self.symmetric_difference(other_set)
+
+
+    def __ior__(self, other_set):
+        if type(other_set) != type(self):
+            return NotImplemented
+        return self.update(other_set)
+
+
+    def __iand__(self, other_set):
+        if type(other_set) != type(self):
+            return NotImplemented
+        return self.intersection_update(other_set)
+
+
 if __name__ == "__main__":
     s = Set(1, 2, 3, 4, 5)
 
@@ -85,4 +187,12 @@ if __name__ == "__main__":
     p = Set(4, 5, 6, 7, 8)
 
     print(s.union(p))
-    print(s.intersection(p))
\ No newline at end of file
+    print(s.intersection(p))
+    print(s - p, s ^ p, 4 in s)
+
+    s |= Set(100)
+    s &= Set(1, 2, 100, 200)
+    print(s)
+
+    tags = [Set(*range(0, 1000000, step)) for step in (2, 3, 5, 7)]
+    print(len(Set.intersect_all(*tags)), len(Set.intersect_all(Set(1, 2), *tags)))
\ No newline at end of file
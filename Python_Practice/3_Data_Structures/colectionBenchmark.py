@@ -0,0 +1,54 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+getItem cost on crafted colliding names: someone who knows the seed
+searches for names whose hash has the low BITS bits all zero, so they all
+land in bucket 0 for every table size up to 2**BITS buckets. Compares
+plain list buckets (treeify off) with treeified buckets.
+'''
+import sys
+from timeit import default_timer as timer
+
+from variousPractice import Colection
+
+SEED = 12345
+BITS = 11
+
+
+def crafted_names(n):
+    probe = Colection(seed=SEED)
+    mask = (1 << BITS) - 1
+    names = []
+    i = 0
+    while len(names) < n:
+        name = "name-{}".format(i)
+        if probe._getHash(name) & mask == 0:
+            names.append(name)
+        i += 1
+    return names
+
+
+def lookup_time(col, names, rounds=20):
+    start = timer()
+    for _ in range(rounds):
+        for name in names:
+            col.getItem(name)
+    return (timer() - start) / (rounds * len(names))
+
+
+if __name__ == "__main__":
+    # Optional argument: number of colliding names, e.g. "python colectionBenchmark.py 500".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    start = timer()
+    names = crafted_names(n)
+    print("Found {} colliding names in {:.1f}s".format(n, timer() - start))
+
+    for label, threshold in (("list buckets", None), ("treeified buckets", 8)):
+        col = Colection(seed=SEED, treeify_threshold=threshold)
+        for number, name in enumerate(names):
+            col.addItem(name, number)
+        print("{:>18}: longest chain {:>5}, getItem {:.2f}us".format(
+            label, max(col.chainHistogram()), lookup_time(col, names) * 1e6))
@@ -0,0 +1,225 @@
+'''
+Created on 18 Oct 2026
+@author: M.Laptop
+'''
+from bisect import bisect_left
+
+_NO_VALUE = object()
+
+
+class _Node:
+    ''' One node of the radix tree. label is the piece of the key on the
+        edge that leads here. Children are kept in two parallel lists
+        sorted by the first character of their label (firsts[i] belongs
+        to children[i]) instead of a dict per node, which keeps millions
+        of nodes small and gives sorted iteration for free.
+        size is the number of keys stored in this subtree.
+    '''
+    __slots__ = ("label", "firsts", "children", "value", "size")
+
+    def __init__(self, label, value=_NO_VALUE, size=0):
+        self.label = label
+        self.firsts = []
+        self.children = []
+        self.value = value
+        self.size = size
+
+    def child(self, char):
+        ''' index of the child whose label starts with char, -1 if there is none '''
+        i = bisect_left(self.firsts, char)
+        if i < len(self.firsts) and self.firsts[i] == char:
+            return i
+        return -1
+
+
+def _common_length(a, b, start):
+    ''' length of the common prefix of a and b[start:] '''
+    n = min(len(a), len(b) - start)
+    i = 0
+    while i < n and a[i] == b[start + i]:
+        i += 1
+    return i
+
+
+class RadixTree:
+    ''' Compact prefix tree (Patricia trie) of string keys with optional values.
+        Chains of single-child nodes are merged into one edge, so the
+        tree has at most two nodes per key.
+        Operations:
+            insert(key, value)
+            remove(key)
+            get(key)
+            prefix_search(prefix, limit)
+            count_prefix(prefix)
+            iteration in sorted key order
+    '''
+
+    def __init__(self, keys=()):
+        self._root = _Node("")
+        for key in keys:
+            self.insert(key)
+
+    def insert(self, key, value=None):
+        ''' add key, or replace its value if it is already there '''
+        node = self._root
+        path = [node]
+        pos = 0
+
+        while pos < len(key):
+            i = node.child(key[pos])
+            if i < 0:
+                # Nothing shares the next character: hang the rest of the key here.
+                leaf = _Node(key[pos:], value, size=1)
+                at = bisect_left(node.firsts, key[pos])
+                node.firsts.insert(at, key[pos])
+                node.children.insert(at, leaf)
+                for parent in path:
+                    parent.size += 1
+                return
+
+            child = node.children[i]
+            common = _common_length(child.label, key, pos)
+            if common < len(child.label):
+                # The key leaves the edge half way: split it with a new middle node.
+                middle = _Node(child.label[:common], size=child.size)
+                child.label = child.label[common:]
+                middle.firsts.append(child.label[0])
+                middle.children.append(child)
+                node.children[i] = middle
+                child = middle
+
+            node = child
+            path.append(node)
+            pos += common
+
+        if node.value is _NO_VALUE:
+            for parent in path:
+                parent.size += 1
+        node.value = value
+
+    def _find(self, key):
+        ''' path of nodes down to key, or None when key is not in the tree '''
+        node = self._root
+        path = [node]
+        pos = 0
+        while pos < len(key):
+            i = node.child(key[pos])
+            if i < 0:
+                return None
+            node = node.children[i]
+            if not key.startswith(node.label, pos):
+                return None
+            path.append(node)
+            pos += len(node.label)
+        return path if node.value is not _NO_VALUE else None
+
+    def get(self, key, default=None):
+        path = self._find(key)
+        return path[-1].value if path is not None else default
+
+    def remove(self, key):
+        ''' delete key, merging nodes that are left with a single child
+            raises KeyError if key is not in the tree
+        '''
+        path = self._find(key)
+        if path is None:
+            raise KeyError(key)
+
+        node = path[-1]
+        node.value = _NO_VALUE
+        for parent in path:
+            parent.size -= 1
+
+        if node is self._root:
+            return
+
+        parent = path[-2]
+        if not node.children:
+            i = parent.child(node.label[0])
+            del parent.firsts[i]
+            del parent.children[i]
+            # The parent may now be a valueless node with one child: merge it below.
+            if parent is self._root:
+                return
+            node, parent = parent, path[-3]
+            if node.value is not _NO_VALUE or len(node.children) != 1:
+                return
+
+        if len(node.children) == 1:
+            only = node.children[0]
+            only.label = node.label + only.label
+            parent.children[parent.child(node.label[0])] = only
+
+    def _locate(self, prefix):
+        ''' node whose subtree holds exactly the keys starting with prefix,
+            and the key spelled out down to that node; (None, None) if no key matches
+        '''
+        node = self._root
+        pos = 0
+        while pos < len(prefix):
+            i = node.child(prefix[pos])
+            if i < 0:
+                return None, None
+            child = node.children[i]
+            common = _common_length(child.label, prefix, pos)
+            if pos + common == len(prefix):
+                # The prefix ends on or inside this edge: the whole subtree matches.
+                return child, prefix[:pos] + child.label
+            if common < len(child.label):
+                return None, None
+            node = child
+            pos += common
+        return node, prefix
+
+    def count_prefix(self, prefix):
+        ''' number of keys starting with prefix, O(len(prefix)) '''
+        node, _ = self._locate(prefix)
+        return node.size if node is not None else 0
+
+    def prefix_search(self, prefix, limit=None):
+        ''' sorted list of (key, value) for keys starting with prefix, at most limit of them '''
+        node, key = self._locate(prefix)
+        if node is None:
+            return []
+        return list(self._walk(node, key, limit))
+
+    def _walk(self, node, key, limit=None):
+        ''' yield (key, value) below node in sorted order, depth first '''
+        if limit is not None and limit <= 0:
+            return
+        found = 0
+        stack = [(node, key)]
+        while stack:
+            node, key = stack.pop()
+            if node.value is not _NO_VALUE:
+                yield key, node.value
+                found += 1
+                if found == limit:
+                    return
+            # Push in reverse so the smallest first character is visited next.
+            for child in reversed(node.children):
+                stack.append((child, key + child.label))
+
+    def items(self):
+        return self._walk(self._root, "")
+
+    def __iter__(self):
+        return (key for key, _ in self._walk(self._root, ""))
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self._root.size
+
+
+if __name__ == "__main__":
+    tree = RadixTree(["Marina", "Maria", "Marek", "Wiesia", "Frania", "Ziuta"])
+    tree.insert("Mariola", "555-123")
+
+    print(list(tree))
+    print(tree.prefix_search("Mar", limit=3))
+    print(tree.count_prefix("Mari"), tree.count_prefix("X"), len(tree))
+
+    tree.remove("Maria")
+    print(tree.prefix_search("Mari"), "Maria" in tree)
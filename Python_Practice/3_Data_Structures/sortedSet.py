@@ -0,0 +1,321 @@
+'''
+Created on 18 Oct 2026
+@author: M.Laptop
+'''
+from bisect import bisect_left, bisect_right
+
+
+class SortedSet:
+    ''' Set that keeps its items in order, as a list of sorted chunks
+        (the layout sortedcontainers uses). Each chunk holds between
+        load // 2 and 2 * load items, so inserting shifts at most a
+        couple of thousand pointers, and _maxes (the last item of each
+        chunk) finds the right chunk with one bisect.
+        _index is a Fenwick tree over the chunk lengths; it turns a
+        position into a chunk and back in O(log chunks), which gives
+        rank() and nth(). It is rebuilt lazily after a chunk is split
+        or dropped.
+        Operations:
+            add(item), remove(item), discard(item)
+            rank(item), bisect_left(item), bisect_right(item)
+            nth(k)
+            irange(lo, hi) - items between lo and hi, in order
+    '''
+
+    def __init__(self, items=(), load=1000):
+        self._load = load
+        self._lists = []
+        self._maxes = []
+        self._index = None
+        values = sorted(set(items))
+        for start in range(0, len(values), load):
+            chunk = values[start:start + load]
+            self._lists.append(chunk)
+            self._maxes.append(chunk[-1])
+        self._len = len(values)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._lists:
+            yield from chunk
+
+    def __reversed__(self):
+        for chunk in reversed(self._lists):
+            yield from reversed(chunk)
+
+    def __contains__(self, item):
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            return False
+        chunk = self._lists[i]
+        j = bisect_left(chunk, item)
+        return chunk[j] == item
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
+
+    def add(self, item):
+        ''' add item, O(log n) plus a shift inside one chunk '''
+        if not self._maxes:
+            self._lists.append([item])
+            self._maxes.append(item)
+            self._index = None
+            self._len = 1
+            return
+
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            # Bigger than everything: it goes at the end of the last chunk.
+            i -= 1
+            self._lists[i].append(item)
+            self._maxes[i] = item
+        else:
+            chunk = self._lists[i]
+            j = bisect_left(chunk, item)
+            if chunk[j] == item:
+                return
+            chunk.insert(j, item)
+
+        self._len += 1
+        if len(self._lists[i]) > 2 * self._load:
+            self._split(i)
+        elif self._index is not None:
+            self._update_index(i, 1)
+
+    def _split(self, i):
+        chunk = self._lists[i]
+        half = chunk[self._load:]
+        del chunk[self._load:]
+        self._maxes[i] = chunk[-1]
+        self._lists.insert(i + 1, half)
+        self._maxes.insert(i + 1, half[-1])
+        self._index = None
+
+    def remove(self, item):
+        ''' delete item, raises KeyError if it is not there '''
+        i = bisect_left(self._maxes, item)
+        if i < len(self._maxes):
+            chunk = self._lists[i]
+            j = bisect_left(chunk, item)
+            if chunk[j] == item:
+                self._delete(i, j)
+                return
+        raise KeyError(item)
+
+    def discard(self, item):
+        if item in self:
+            self.remove(item)
+
+    def _delete(self, i, j):
+        chunk = self._lists[i]
+        del chunk[j]
+        self._len -= 1
+
+        if not chunk:
+            del self._lists[i]
+            del self._maxes[i]
+            self._index = None
+            return
+        self._maxes[i] = chunk[-1]
+
+        if len(chunk) < self._load // 2 and len(self._lists) > 1:
+            # Fold a small chunk into its neighbour, splitting again if that gets too big.
+            k = i - 1 if i > 0 else i
+            self._lists[k].extend(self._lists[k + 1])
+            del self._lists[k + 1]
+            del self._maxes[k]
+            self._maxes[k] = self._lists[k][-1]
+            self._index = None
+            if len(self._lists[k]) > 2 * self._load:
+                self._split(k)
+        elif self._index is not None:
+            self._update_index(i, -1)
+
+    def _build_index(self):
+        ''' Fenwick tree of the chunk lengths, built in O(chunks) '''
+        index = [0] + [len(chunk) for chunk in self._lists]
+        for i in range(1, len(index)):
+            parent = i + (i & -i)
+            if parent < len(index):
+                index[parent] += index[i]
+        self._index = index
+
+    def _update_index(self, i, delta):
+        index = self._index
+        i += 1
+        while i < len(index):
+            index[i] += delta
+            i += i & -i
+
+    def _offset(self, i):
+        ''' number of items in the chunks before chunk i '''
+        if self._index is None:
+            self._build_index()
+        index = self._index
+        total = 0
+        while i > 0:
+            total += index[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, k):
+        ''' (chunk, position in chunk) of the k-th item, 0 <= k < len(self) '''
+        if self._index is None:
+            self._build_index()
+        index = self._index
+        i = 0
+        step = 1 << (len(index) - 1).bit_length()
+        while step:
+            if i + step < len(index) and index[i + step] <= k:
+                i += step
+                k -= index[i]
+            step >>= 1
+        return i, k
+
+    def bisect_left(self, item):
+        ''' number of items smaller than item '''
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_left(self._lists[i], item)
+
+    def bisect_right(self, item):
+        ''' number of items smaller than or equal to item '''
+        i = bisect_right(self._maxes, item)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_right(self._lists[i], item)
+
+    rank = bisect_left
+
+    def nth(self, k):
+        ''' k-th smallest item, counting from 0; negative k counts from the end '''
+        if k < 0:
+            k += self._len
+        if not 0 <= k < self._len:
+            raise IndexError("SortedSet index out of range")
+        i, j = self._locate(k)
+        return self._lists[i][j]
+
+    __getitem__ = nth
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        ''' iterate over the items between lo and hi (None = no bound), without sorting anything '''
+        if lo is None:
+            start = 0
+        else:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        if hi is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+        return self.islice(start, stop, reverse)
+
+    def islice(self, start, stop, reverse=False):
+        ''' iterate over the items at positions start..stop-1 '''
+        if start >= stop:
+            return iter(())
+        i, j = self._locate(start)
+        last_i, last_j = self._locate(stop - 1)
+        if reverse:
+            return self._walk_back(i, j, last_i, last_j)
+        return self._walk(i, j, last_i, last_j)
+
+    def _walk(self, i, j, last_i, last_j):
+        if i == last_i:
+            yield from self._lists[i][j:last_j + 1]
+            return
+        yield from self._lists[i][j:]
+        for chunk in self._lists[i + 1:last_i]:
+            yield from chunk
+        yield from self._lists[last_i][:last_j + 1]
+
+    def _walk_back(self, i, j, last_i, last_j):
+        if i == last_i:
+            yield from reversed(self._lists[i][j:last_j + 1])
+            return
+        yield from reversed(self._lists[last_i][:last_j + 1])
+        for chunk in reversed(self._lists[i + 1:last_i]):
+            yield from reversed(chunk)
+        yield from reversed(self._lists[i][j:])
+
+
+class SortedMap:
+    ''' dict whose keys are kept in order by a SortedSet, with the same
+        rank/nth/irange queries on the keys
+    '''
+
+    def __init__(self, pairs=(), load=1000):
+        self._data = dict(pairs)
+        self._keys = SortedSet(self._data, load)
+
+    def __setitem__(self, key, value):
+        if key not in self._data:
+            self._keys.add(key)
+        self._data[key] = value
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._keys.remove(key)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self.items()))
+
+    def keys(self):
+        return iter(self._keys)
+
+    def items(self):
+        return ((key, self._data[key]) for key in self._keys)
+
+    def rank(self, key):
+        return self._keys.rank(key)
+
+    def bisect_left(self, key):
+        return self._keys.bisect_left(key)
+
+    def bisect_right(self, key):
+        return self._keys.bisect_right(key)
+
+    def nth(self, k):
+        ''' (key, value) of the k-th smallest key '''
+        key = self._keys.nth(k)
+        return key, self._data[key]
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        ''' iterate over the keys between lo and hi '''
+        return self._keys.irange(lo, hi, inclusive, reverse)
+
+    def irange_items(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        ''' iterate over the (key, value) pairs with keys between lo and hi '''
+        return ((key, self._data[key]) for key in self._keys.irange(lo, hi, inclusive, reverse))
+
+
+if __name__ == "__main__":
+    s = SortedSet([54, 35, 34, 344, 15, 347])
+    s.add(100)
+    s.remove(35)
+
+    print(s, len(s))
+    print(list(s.irange(30, 344)), s.rank(100), s.nth(0), s.nth(-1))
+
+    book = SortedMap()
+    for name in ["Marina", "Maria", "Marek", "Wiesia", "Frania", "Ziuta"]:
+        book[name] = len(name)
+    print(list(book.irange_items("Mar", "Mas")), book.nth(0), book.rank("Wiesia"))
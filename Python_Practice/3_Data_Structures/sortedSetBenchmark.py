@@ -0,0 +1,82 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+"All keys between a and b" while keys keep arriving: one range query after
+every QUERY_EVERY inserts. Compares SortedSet.irange with what we do today,
+sorting a plain list or the keys of the dict based Set before each query.
+'''
+import os
+import random
+import sys
+from bisect import bisect_left, bisect_right
+from timeit import default_timer as timer
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "1_basic_datastructures", "sets"))
+from setImplementation import Set
+from sortedSet import SortedSet
+
+QUERY_EVERY = 100
+SPAN = 1000
+
+
+def workload(n, seed=1):
+    rnd = random.Random(seed)
+    keys = [rnd.randrange(n * 100) for _ in range(n)]
+    ranges = [(lo, lo + SPAN * 100) for lo in (rnd.randrange(n * 100) for _ in range(n // QUERY_EVERY))]
+    return keys, ranges
+
+
+def run_sorted_list(keys, ranges):
+    items, found = [], 0
+    for q, (lo, hi) in enumerate(ranges):
+        items.extend(keys[q * QUERY_EVERY:(q + 1) * QUERY_EVERY])
+        ordered = sorted(set(items))
+        found += len(ordered[bisect_left(ordered, lo):bisect_right(ordered, hi)])
+    return found
+
+
+def run_set(keys, ranges):
+    items, found = Set(), 0
+    for q, (lo, hi) in enumerate(ranges):
+        for key in keys[q * QUERY_EVERY:(q + 1) * QUERY_EVERY]:
+            items.add_item(key)
+        ordered = sorted(items)
+        found += len(ordered[bisect_left(ordered, lo):bisect_right(ordered, hi)])
+    return found
+
+
+def run_sorted_set(keys, ranges):
+    items, found = SortedSet(), 0
+    for q, (lo, hi) in enumerate(ranges):
+        for key in keys[q * QUERY_EVERY:(q + 1) * QUERY_EVERY]:
+            items.add(key)
+        found += sum(1 for _ in items.irange(lo, hi))
+    return found
+
+
+if __name__ == "__main__":
+    # Optional argument: number of keys, e.g. "python sortedSetBenchmark.py 200000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    keys, ranges = workload(n)
+    print("{} keys, a range query every {} inserts".format(n, QUERY_EVERY))
+
+    expected = None
+    for label, run in (("re-sorted list", run_sorted_list), ("Set + sorted()", run_set),
+                       ("SortedSet.irange", run_sorted_set)):
+        start = timer()
+        found = run(keys, ranges)
+        elapsed = timer() - start
+        assert expected is None or found == expected
+        expected = found
+        print("{:>18}: {:8.2f}s".format(label, elapsed))
+
+    s = SortedSet(keys)
+    probes = random.Random(2).sample(range(len(s)), 10000)
+    for label, fn in (("rank", lambda k: s.rank(k * 100)), ("nth", s.nth),
+                      ("add+remove", lambda k: (s.add(-k), s.remove(-k)))):
+        start = timer()
+        for k in probes:
+            fn(k)
+        print("{:>18}: {:8.2f}us".format(label, (timer() - start) / len(probes) * 1e6))
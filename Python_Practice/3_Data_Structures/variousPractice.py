@@ -3,6 +3,12 @@ Created on 22 Dec 2019
 @author: M.Laptop
 '''
 #from builtins import False
+from bisect import bisect_left, bisect_right
+from hashlib import blake2b
+from itertools import chain, islice
+import os
+
+from radixTree import RadixTree
 
 lista1 = []
 
@@ -13,134 +19,295 @@ lista1 = []
 #print(len(lista1))
 
 
-class Colection:    
+class _TreeBin:
+    ''' A long bucket kept sorted by hash, so a lookup is a binary
+        search (bisect) instead of walking the whole chain.
+        hashes[i] is the hash of pairs[i].
+    '''
+    __slots__ = ("hashes", "pairs")
+
+    def __init__(self, pairs):
+        self.pairs = sorted(pairs, key=lambda pair: pair[2])
+        self.hashes = [pair[2] for pair in self.pairs]
+
+    def find(self, key, hash):
+        ''' index of the pair with this key, -1 if there is none '''
+        i = bisect_left(self.hashes, hash)
+        while i < len(self.hashes) and self.hashes[i] == hash:
+            if self.pairs[i][0] == key:
+                return i
+            i += 1
+        return -1
+
+    def add(self, pair):
+        i = bisect_right(self.hashes, pair[2])
+        self.hashes.insert(i, pair[2])
+        self.pairs.insert(i, pair)
+
+    def remove(self, i):
+        del self.hashes[i]
+        del self.pairs[i]
 
-    def __init__(self):        
-        ''' this is how you create list with fixed size and fill it with one value 
+    def __iter__(self):
+        return iter(self.pairs)
+
+    def __len__(self):
+        return len(self.pairs)
+
+
+class Colection:
+
+    def __init__(self, seed=None, max_chain=2.0, treeify_threshold=8, untreeify_threshold=6,
+                 prefix_index=False):
+        ''' this is how you create list with fixed size and fill it with one value
             it is null in this case
-        '''       
+            seed      - key of the hash function, random when not given
+            max_chain - average chain length (items per bucket) that makes
+                        the table double its number of buckets
+            treeify_threshold   - a bucket longer than this becomes a sorted
+                                  _TreeBin (None never does it)
+            untreeify_threshold - a _TreeBin this short goes back to a list
+            prefix_index - also keep every str(key) in a RadixTree, so
+                           prefixSearch/countPrefix work without scanning buckets;
+                           keys with the same str() (54 and "54") share one
+                           entry, which holds the list of them
+        '''
         self._sizik = 4
         self._table = [None] * self._sizik
-    
+        self._count = 0
+        self._max_chain = max_chain
+        self._treeify = treeify_threshold
+        self._untreeify = untreeify_threshold
+        self._index = RadixTree() if prefix_index else None
+        self._shared = {}       # str(key) -> extra keys in its index entry, when more than one
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self._seed = (seed & 0xFFFFFFFFFFFFFFFF).to_bytes(8, "little")
+
     def _getHash(self, key):
-        ''' This is hash function. It crates hash by
-            taking ASCII number for each char in key
-            and sum the taking reminder of it
+        ''' This is hash function. It is keyed blake2b (the same idea as
+            SipHash): 64 bits that spread anagrams and similar names
+            over all buckets, and a secret seed so nobody can
+            pick names that all land in one bucket.
+            The full hash is kept with each pair so growing the
+            table never has to hash the names again.
         '''
-        hash = 0
-        for char in str(key):
-            hash += ord(char)
-            #print(hash)
-        hash = hash % self._sizik
-        #print(hash)
-        return hash
-     
+        digest = blake2b(str(key).encode("utf-8"), digest_size=8, key=self._seed).digest()
+        return int.from_bytes(digest, "little")
+
+    def _getSlot(self, hash):
+        ''' _sizik is always a power of two, so the low bits of the hash pick the bucket '''
+        return hash & (self._sizik - 1)
+
     ''' this method will add new value to hashTable '''
     def addItem(self, key, value):
         ''' new hash is generated '''
-        key_hash = self._getHash(key)
-        key_value = [key, value]
-        
+        hash = self._getHash(key)
+        key_hash = self._getSlot(hash)
+
         ''' check if slot is not taken already '''
-        print(self._table[key_hash])
-        if self._table[key_hash] is None:
-            self._table[key_hash] = list([key_value])
+        bucket = self._table[key_hash]
+        if bucket is None:
+            self._table[key_hash] = list([[key, value, hash]])
+        elif isinstance(bucket, _TreeBin):
+            i = bucket.find(key, hash)
+            if i >= 0:
+                bucket.pairs[i][1] = value
+                return True
+            bucket.add([key, value, hash])
         else:
-            for pair in self._table[key_hash]:
-                #print("Juz cos jest")
-                if pair[0] == key:
+            for pair in bucket:
+                if pair[2] == hash and pair[0] == key:
                     pair[1] = value
                     return True
-            self._table[key_hash].append(key_value)        
-        #print(self._table[key_hash])
+            bucket.append([key, value, hash])
+            if self._treeify is not None and len(bucket) > self._treeify:
+                self._table[key_hash] = _TreeBin(bucket)
+
+        self._count += 1
+        if self._index is not None:
+            self._indexKey(key)
+        ''' too many items per bucket on average, double the buckets '''
+        if self._count > self._sizik * self._max_chain:
+            self._resize(self._sizik * 2)
         return key_hash
-        
+
     def getItem(self, key):
-        key_hash = self._getHash(key)
-        if self._table[key_hash] is not None:
-            for pair in self._table[key_hash]:
-                if  pair[0] == key:
-                    val = pair[1]
-                    print( "this is requested value ", pair[1])
-                    return val
-                print( "There is no such value  ", key)
-                return None    
-                
+        hash = self._getHash(key)
+        bucket = self._table[self._getSlot(hash)]
+        if isinstance(bucket, _TreeBin):
+            i = bucket.find(key, hash)
+            return bucket.pairs[i][1] if i >= 0 else None
+        if bucket is not None:
+            for pair in bucket:
+                if pair[2] == hash and pair[0] == key:
+                    return pair[1]
+        return None
+
     def delete(self, key):
         ''' new hash is generated '''
-        key_hash = self._getHash(key)               
+        hash = self._getHash(key)
+        key_hash = self._getSlot(hash)
         ''' check if slot is not taken already '''
-        #print(self._table[key_hash])
-        if self._table[key_hash] is None:
+        bucket = self._table[key_hash]
+        if bucket is None:
             return False
-        for i in range(len(self._table[key_hash])):
-            print(key_hash, self._table[i])
-
+        if isinstance(bucket, _TreeBin):
+            i = bucket.find(key, hash)
+            if i < 0:
+                return False
+            bucket.remove(i)
+            if len(bucket) <= self._untreeify:
+                self._table[key_hash] = bucket.pairs or None
+            self._unindex(key)
+            self._count -= 1
+            return True
+        for i in range(len(bucket)):
+            if bucket[i][2] == hash and bucket[i][0] == key:
+                del bucket[i]
+                if not bucket:
+                    self._table[key_hash] = None
+                self._unindex(key)
+                self._count -= 1
+                return True
+        return False
+
+    def _indexKey(self, key):
+        ''' add key to the list of keys in the prefix index entry of str(key) '''
+        text = str(key)
+        keys = self._index.get(text)
+        if keys is None:
+            self._index.insert(text, [key])
+        else:
+            keys.append(key)
+            self._shared[text] = len(keys) - 1
+
+    def _unindex(self, key):
+        ''' drop key from the prefix index; the entry goes when its last key does '''
+        if self._index is None:
+            return
+        text = str(key)
+        keys = self._index.get(text)
+        for i in range(len(keys)):
+            if keys[i] == key:
+                del keys[i]
+                break
+        if not keys:
+            self._index.remove(text)
+        elif len(keys) == 1:
+            del self._shared[text]
+        else:
+            self._shared[text] = len(keys) - 1
+
+    def prefixSearch(self, prefix, limit=None):
+        ''' [key, value] pairs whose str(key) starts with prefix, sorted, at most limit '''
+        if self._index is None:
+            raise ValueError("Colection was created without prefix_index=True")
+        keys = chain.from_iterable(keys for _, keys in self._index.prefix_search(prefix, limit))
+        return [[key, self.getItem(key)] for key in islice(keys, limit)]
+
+    def countPrefix(self, prefix):
+        ''' how many keys start with prefix '''
+        if self._index is None:
+            raise ValueError("Colection was created without prefix_index=True")
+        # Index entries shared by several keys count once in the tree; add the rest.
+        extra = sum(n for text, n in self._shared.items() if text.startswith(prefix))
+        return self._index.count_prefix(prefix) + extra
+
+    def _resize(self, size):
+        ''' move every pair to its bucket in a table of the new size, using the stored hash '''
+        old_table = self._table
+        self._sizik = size
+        self._table = [None] * size
+        for bucket in old_table:
+            if bucket is not None:
+                for pair in bucket:
+                    key_hash = self._getSlot(pair[2])
+                    if self._table[key_hash] is None:
+                        self._table[key_hash] = [pair]
+                    else:
+                        self._table[key_hash].append(pair)
+
+        if self._treeify is not None:
+            for key_hash, bucket in enumerate(self._table):
+                if bucket is not None and len(bucket) > self._treeify:
+                    self._table[key_hash] = _TreeBin(bucket)
+
+    def occupancy(self):
+        ''' how the items spread over the buckets:
+            buckets, used (non-empty) buckets, items, fraction of buckets
+            used and average chain length of the used ones
+        '''
+        used = sum(1 for bucket in self._table if bucket)
+        return {"buckets": self._sizik,
+                "used": used,
+                "items": self._count,
+                "occupancy": used / self._sizik,
+                "average_chain": self._count / used if used else 0.0}
+
+    def treeBins(self):
+        ''' number of buckets currently stored as a _TreeBin '''
+        return sum(1 for bucket in self._table if isinstance(bucket, _TreeBin))
+
+    def chainHistogram(self):
+        ''' chain length -> number of buckets with that many items (0 = empty bucket) '''
+        histogram = {}
+        for bucket in self._table:
+            length = len(bucket) if bucket else 0
+            histogram[length] = histogram.get(length, 0) + 1
+        return dict(sorted(histogram.items()))
+
+    def __len__(self):
+        return self._count
 
-        
-        
     def printMe(self):
         print("--Phonebook--")
         for item in self._table:
             if item is not None:
-                print(str(item))
-                 
-        
-col = Colection()
-#col[3] = "huj"
-#if col == None:       
-    #print(None, "is")  
-#else:
-    #print(None, "is Not")
-    
-#col._getHash("45")    
-
-col.addItem(54, "Marina")
-print(col._table)
-col.addItem(35, "Wiesia")
-print(col._table)
-col.addItem(34, "Frania")
-print(col._table)
-col.addItem(344, "Marina")
-print(col._table)
-col.addItem(15, "Wiesia")
-print(col._table)
-col.addItem(347, "Ziuta")
-print(col._table)
-
-col.getItem(15)
-col.getItem(10) 
-
-print()
-
-col.delete(15)
-
-print()    
-#print(col._table)
-print(col._sizik)
-
-print()
-
-col.printMe()
-
-
-
-
-
-
-
-
-
-
-
+                print(str([pair[:2] for pair in item]))
 
 
+if __name__ == "__main__":
+    col = Colection()
+    #col[3] = "huj"
+    #if col == None:
+        #print(None, "is")
+    #else:
+        #print(None, "is Not")
 
+    #col._getHash("45")
 
+    col.addItem(54, "Marina")
+    print(col._table)
+    col.addItem(35, "Wiesia")
+    print(col._table)
+    col.addItem(34, "Frania")
+    print(col._table)
+    col.addItem(344, "Marina")
+    print(col._table)
+    col.addItem(15, "Wiesia")
+    print(col._table)
+    col.addItem(347, "Ziuta")
+    print(col._table)
 
+    print("this is requested value ", col.getItem(15))
+    print("this is requested value ", col.getItem(10))
 
+    print()
 
+    col.delete(15)
 
+    print()
+    #print(col._table)
+    print(col._sizik)
 
+    print()
 
+    col.printMe()
+    print(col.occupancy())
+    print(col.chainHistogram())
 
+    book = Colection(prefix_index=True)
+    for name in ["Marina", "Maria", "Marek", "Wiesia", "Frania", "Ziuta"]:
+        book.addItem(name, len(name))
+    print(book.prefixSearch("Mar", limit=2), book.countPrefix("Mar"))
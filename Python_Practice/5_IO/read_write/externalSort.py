@@ -0,0 +1,237 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+External merge sort: sorts a text file of lines (log lines, CSV/TSV
+records) that is bigger than memory.
+
+1. The file is cut into byte ranges that end on a line break, one per
+   worker process. Each worker reads its range chunk_size bytes at a
+   time, sorts the chunk with list.sort and spills it to a temp file as
+   a sorted run. Workers open the file themselves, so no lines are sent
+   between processes.
+2. The runs are merged with heapq.merge, fan_in runs at a time (more
+   passes if there are more runs than that), reading and writing
+   through 1 MB buffers.
+
+Memory: every worker holds one chunk as a list of str, which takes
+about 2-3 times chunk_size. For a 200 GB file on a 16 GB host,
+chunk_size=1 GB with workers=4 gives 200 runs and one merge pass.
+'''
+import heapq
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+BUFFER = 1 << 20
+
+_LINE = re.compile("[^\n]*\n")
+
+
+def _line(line):
+    return line.rstrip("\r\n")
+
+
+def _field(index, separator, line):
+    return line.split(separator)[index]
+
+
+def field_key(index, separator=None):
+    ''' key that picks field index of the line (split on separator, whitespace by default);
+        unlike a lambda it can be sent to worker processes
+    '''
+    return partial(_field, index, separator)
+
+
+def _sort_key(key, numeric):
+    ''' the key actually used: the line itself or key(line), as a float in numeric mode '''
+    if key is None:
+        key = _line
+    if numeric:
+        return lambda line: float(key(line))
+    return key
+
+
+def _dedup(lines, sort_key):
+    ''' lines (sorted) with only the first line of every run of equal keys '''
+    last = object()
+    for line in lines:
+        value = sort_key(line)
+        if value != last:
+            last = value
+            yield line
+
+
+def _ranges(path, parts):
+    ''' byte ranges (start, stop) of path, each starting at a line start '''
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, cuts[-1]))
+            f.readline()
+            cuts.append(min(f.tell(), size))
+    cuts.append(size)
+    return [(start, stop) for start, stop in zip(cuts, cuts[1:]) if start < stop]
+
+
+def _remove(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _write_run(lines, tmp_dir, encoding):
+    fd, run = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    try:
+        with open(fd, "w", encoding=encoding, newline="\n", buffering=BUFFER) as f:
+            f.writelines(lines)
+    except BaseException:
+        os.remove(run)
+        raise
+    return run
+
+
+def _sort_range(path, start, stop, chunk_size, key, numeric, unique, reverse, tmp_dir, encoding):
+    ''' worker: sort path[start:stop] in chunks, return the paths of the sorted runs;
+        if anything fails the runs written so far are deleted before the error is raised
+    '''
+    sort_key = _sort_key(key, numeric)
+    runs = []
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            while f.tell() < stop:
+                data = f.read(min(chunk_size, stop - f.tell()))
+                if f.tell() < stop:
+                    data += f.readline()        # finish the line the chunk ends in
+                text = data.decode(encoding)
+                if not text.endswith("\n"):
+                    text += "\n"                # last line of the file
+                # Split on "\n" only: str.splitlines would also cut at \r, \x0b, \u2028, ...
+                lines = _LINE.findall(text)
+                lines.sort(key=sort_key, reverse=reverse)
+                runs.append(_write_run(_dedup(lines, sort_key) if unique else lines, tmp_dir, encoding))
+    except BaseException:
+        _remove(runs)
+        raise
+    return runs
+
+
+def _merge(runs, output, sort_key, unique, reverse, encoding):
+    files = [open(run, encoding=encoding, newline="\n", buffering=BUFFER) for run in runs]
+    try:
+        merged = heapq.merge(*files, key=sort_key, reverse=reverse)
+        if unique:
+            merged = _dedup(merged, sort_key)
+        count = 0
+        with open(output, "w", encoding=encoding, newline="\n", buffering=BUFFER) as out:
+            for line in merged:
+                out.write(line)
+                count += 1
+        return count
+    finally:
+        for f in files:
+            f.close()
+
+
+def external_sort(src, dst, key=None, numeric=False, unique=False, reverse=False,
+                  chunk_size=256 << 20, workers=1, fan_in=128, tmp_dir=None, encoding="utf-8"):
+    """
+        Sort the lines of file src into file dst, returns the number of lines written.
+        :param key: function of the line (a str with its line break) to sort by,
+                    the whole line when None; with workers > 1 it must be picklable
+                    (a module level function or field_key(...), not a lambda).
+        :param numeric: compare float(key) instead of text.
+        :param unique: keep only the first line of every group with the same key (sort -u).
+        :param chunk_size: bytes of src each worker sorts in memory at a time.
+        :param workers: processes sorting chunks in parallel.
+        :param fan_in: most runs merged (files open) at once.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    sort_key = _sort_key(key, numeric)
+    job = partial(_sort_range, src, chunk_size=chunk_size, key=key, numeric=numeric,
+                  unique=unique, reverse=reverse, tmp_dir=tmp_dir, encoding=encoding)
+
+    ranges = _ranges(src, workers)
+    if not ranges:
+        open(dst, "w").close()
+        return 0
+
+    runs = []
+    spilled = []            # Every temp file made here, deleted at the end whatever happens.
+    try:
+        if workers == 1:
+            runs = job(*ranges[0])
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                futures = [pool.submit(job, start, stop) for start, stop in ranges]
+            # Leaving the pool waited for every worker: keep the runs of those
+            # that finished, so they are deleted too if another one failed.
+            for future in futures:
+                if future.exception() is None:
+                    runs.extend(future.result())
+            for future in futures:
+                future.result()
+        spilled.extend(runs)
+
+        # Too many runs to open at once: merge them in groups into fewer, longer runs.
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                fd, run = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+                os.close(fd)
+                spilled.append(run)
+                _merge(group, run, sort_key, unique, reverse, encoding)
+                merged.append(run)
+                _remove(group)
+            runs = merged
+
+        return _merge(runs, dst, sort_key, unique, reverse, encoding)
+    finally:
+        _remove(spilled + runs)
+
+
+if __name__ == "__main__":
+    import random
+    from timeit import default_timer as timer
+
+    folder = tempfile.mkdtemp()
+    src, dst = os.path.join(folder, "log.txt"), os.path.join(folder, "sorted.txt")
+
+    rnd = random.Random(1)
+    lines = ["{}\tuser{}\t{}\n".format(rnd.randrange(10 ** 6), rnd.randrange(1000), rnd.random())
+             for _ in range(500000)]
+    with open(src, "w") as f:
+        f.writelines(lines)
+
+    start = timer()
+    count = external_sort(src, dst, key=field_key(0, "\t"), numeric=True, chunk_size=1 << 20, workers=2)
+    print(count, "lines in {:.2f}s".format(timer() - start))
+    with open(dst) as f:
+        print(f.read() == "".join(sorted(lines, key=lambda line: float(line.split("\t")[0]))))
+
+    count = external_sort(src, dst, key=field_key(1, "\t"), unique=True, chunk_size=1 << 20, fan_in=4)
+    print(count, "distinct users")
+
+    # A line that is not a number fails the numeric sort; no run may be left in tmp_dir.
+    runs_dir = os.path.join(folder, "runs")
+    os.mkdir(runs_dir)
+    with open(src, "a") as f:
+        f.write("not a number\tuser0\t0.5\n")
+    for workers in (1, 4):
+        try:
+            external_sort(src, dst, key=field_key(0, "\t"), numeric=True, chunk_size=1 << 18,
+                          workers=workers, tmp_dir=runs_dir)
+        except ValueError as error:
+            print(error, "- runs left:", len(os.listdir(runs_dir)))
+    os.rmdir(runs_dir)
+
+    os.remove(src)
+    os.remove(dst)
+    os.rmdir(folder)
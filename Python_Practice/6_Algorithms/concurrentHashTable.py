@@ -0,0 +1,234 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+'''
+import sys
+import threading
+
+from hashTableInplementation import HashTable
+
+# Free-threaded builds (3.13t and later) report False here, everything else has a GIL.
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+_MISSING = object()
+_TORN = object()
+
+class _Shard:
+    """
+        One HashTable with its own lock. version is a sequence counter:
+        writers make it odd while they change the table and even again
+        when they are done, so a reader without the lock can tell whether
+        a write overlapped its lookup.
+    """
+    __slots__ = ("table", "lock", "version")
+
+    def __init__(self, capacity):
+        # Incremental resize is off: a get() must never move entries, or
+        # lock-free readers would be writing too.
+        self.table = HashTable(capacity=capacity)
+        self.lock = threading.Lock()
+        self.version = 0
+
+class ConcurrentHashTable:
+    """
+        ConcurrentHashTable: HashTable that many threads can share.
+        Operations:
+            put(key, value)
+            get(key)
+            delete(key)
+            put_if_absent(key, value)
+            compute_if_absent(key, fn)
+            update(key, fn)
+
+        Keys are split by hash over a fixed number of shards, each a plain
+        HashTable behind its own lock, so writers to different shards do
+        not wait for each other. With the GIL a reader does not take the
+        lock at all: it checks the shard's version before and after the
+        lookup and only retries under the lock if a write overlapped.
+        On a free-threaded interpreter every read takes the shard lock.
+    """
+
+    def __init__(self, shards=16, capacity=8, lock_free_reads=None):
+        """
+            Define an empty concurrent hashtable.
+            :param shards: number of independently locked shards, rounded up to a power of two.
+            :param capacity: initial capacity of each shard.
+            :param lock_free_reads: read without the lock; defaults to True when the GIL is enabled.
+        """
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+
+        bits = 0
+        while (1 << bits) < shards:
+            bits += 1
+
+        self._shift = 64 - bits
+        self._shards = [_Shard(capacity) for _ in range(1 << bits)]
+        self._lock_free_reads = _GIL_ENABLED if lock_free_reads is None else lock_free_reads
+
+    def _shard(self, key):
+        """
+            Pick the shard from the top bits of the mixed hash. The low bits
+            are what each shard's own table uses, so they must not decide the shard.
+        """
+        if self._shift == 64:
+            return self._shards[0]
+        mixed = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return self._shards[mixed >> self._shift]
+
+    def get(self, key, default=None):
+        """
+            Return the value for a particular key.
+            :param key: key for which value is returned.
+            :param default: returned when the key is not in the table.
+            :return: value corresponding to the key.
+        """
+        shard = self._shard(key)
+
+        if self._lock_free_reads:
+            version = shard.version
+            if not version & 1:
+                try:
+                    value = shard.table.get(key, default)
+                except Exception:
+                    # A torn read can fail half way through, the locked read below settles it.
+                    value = _TORN
+                if value is not _TORN and shard.version == version:
+                    return value
+
+        with shard.lock:
+            return shard.table.get(key, default)
+
+    def put(self, key, value):
+        """
+            Add a key-value pair into the hash table.
+            :param key: key is item used to calculate the hash
+            :param value: Actual value stored in the slot.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            shard.version += 1
+            try:
+                shard.table.put(key, value)
+            finally:
+                shard.version += 1
+
+    def delete(self, key):
+        """
+            Remove a key from the table.
+            :param key: key to remove.
+            :raises: KeyError if the key is not in the table.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            shard.version += 1
+            try:
+                shard.table.delete(key)
+            finally:
+                shard.version += 1
+
+    def put_if_absent(self, key, value):
+        """
+            Atomically add the pair unless the key is already there, like dict.setdefault.
+            :return: the value stored for key after the call.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            current = shard.table.get(key, _MISSING)
+            if current is not _MISSING:
+                return current
+
+            shard.version += 1
+            try:
+                shard.table.put(key, value)
+            finally:
+                shard.version += 1
+            return value
+
+    def compute_if_absent(self, key, fn):
+        """
+            Atomically store fn(key) unless the key is already there. fn runs
+            at most once per missing key, under the shard lock, so it must
+            not touch this table.
+            :param fn: called with the key to produce the value.
+            :return: the value stored for key after the call.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            current = shard.table.get(key, _MISSING)
+            if current is not _MISSING:
+                return current
+
+            value = fn(key)
+            shard.version += 1
+            try:
+                shard.table.put(key, value)
+            finally:
+                shard.version += 1
+            return value
+
+    def update(self, key, fn, default=None):
+        """
+            Atomically replace the value of key with fn(value), e.g. a counter
+            increment. fn runs under the shard lock, so it must not touch this table.
+            :param fn: called with the current value, or default if the key is missing.
+            :param default: value passed to fn for a missing key.
+            :return: the new value.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            value = fn(shard.table.get(key, default))
+            shard.version += 1
+            try:
+                shard.table.put(key, value)
+            finally:
+                shard.version += 1
+            return value
+
+    def items(self):
+        """
+            Snapshot of all (key, value) pairs. Each shard is copied under its
+            own lock, so the result is consistent per shard, not across shards.
+        """
+        result = []
+        for shard in self._shards:
+            with shard.lock:
+                result.extend(shard.table.items())
+        return result
+
+    def __iter__(self):
+        return iter(self.items())
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return sum(len(shard.table) for shard in self._shards)
+
+
+if __name__ == "__main__":
+    c_t = ConcurrentHashTable(shards=4)
+
+    def count_words(words):
+        for word in words:
+            c_t.update(word, lambda n: n + 1, default=0)
+
+    workers = [threading.Thread(target=count_words, args=(["a", "b", "a", "c"] * 1000,))
+               for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    print(sorted(c_t.items()))
+    print(c_t.put_if_absent("a", 0), c_t.compute_if_absent("d", len), len(c_t))
@@ -0,0 +1,90 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Throughput of a shared table at 1-32 threads on a mixed read/write load:
+one HashTable behind a single global lock against ConcurrentHashTable.
+When the running interpreter has a GIL and a free-threaded one
+(python3.13t, python3.14t) is on the PATH, the run is repeated there.
+'''
+import random
+import shutil
+import subprocess
+import sys
+import threading
+from timeit import default_timer as timer
+
+from concurrentHashTable import ConcurrentHashTable, _GIL_ENABLED
+from hashTableInplementation import HashTable
+
+
+class GlobalLockTable:
+    """
+        What we do today: every call takes the same lock.
+    """
+
+    def __init__(self):
+        self._table = HashTable()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._table.get(key)
+
+    def put(self, key, value):
+        with self._lock:
+            self._table.put(key, value)
+
+
+KEYS = 100000
+OPS = 400000
+
+
+def worker(table, ops, write_ratio, seed):
+    rnd = random.Random(seed)
+    for _ in range(ops):
+        key = rnd.randrange(KEYS)
+        if rnd.random() < write_ratio:
+            table.put(key, key)
+        else:
+            table.get(key)
+
+
+def throughput(table, threads, write_ratio):
+    for key in range(KEYS):
+        table.put(key, key)
+
+    workers = [threading.Thread(target=worker, args=(table, OPS // threads, write_ratio, seed))
+               for seed in range(threads)]
+    start = timer()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return OPS / (timer() - start)
+
+
+def run():
+    print("{} (GIL {})".format(sys.version.split()[0], "enabled" if _GIL_ENABLED else "disabled"))
+    print("{:>8} {:>8} {:>18} {:>18}".format("threads", "writes", "global lock op/s", "sharded op/s"))
+    for write_ratio in (0.1, 0.5):
+        for threads in (1, 2, 4, 8, 16, 32):
+            print("{:>8} {:>7.0%} {:>18,.0f} {:>18,.0f}".format(
+                threads, write_ratio,
+                throughput(GlobalLockTable(), threads, write_ratio),
+                throughput(ConcurrentHashTable(), threads, write_ratio)))
+
+
+if __name__ == "__main__":
+    run()
+
+    if _GIL_ENABLED and "--no-free-threaded" not in sys.argv:
+        for name in ("python3.14t", "python3.13t"):
+            interpreter = shutil.which(name)
+            if interpreter:
+                print()
+                subprocess.run([interpreter, __file__, "--no-free-threaded"], check=True)
+                break
+        else:
+            print("\nNo free-threaded interpreter found, skipped.")
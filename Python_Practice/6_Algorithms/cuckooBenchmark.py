@@ -0,0 +1,75 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Tail latency of get() for HashTable (linear probing) and CuckooHashTable
+on three key sets:
+    random     - random 60 bit ints, the friendly case
+    clustered  - runs of consecutive ints, so home slots are packed together
+    strided    - multiples of 2**20, every key has the same home slot in HashTable
+Every get is timed on its own.
+'''
+import random
+import sys
+from time import perf_counter_ns
+
+from cuckooHashTable import CuckooHashTable
+from hashTableInplementation import HashTable
+
+
+def random_keys(n):
+    return random.sample(range(1 << 60), n)
+
+
+def clustered_keys(n):
+    keys = []
+    while len(keys) < n:
+        start = random.randrange(1 << 40)
+        keys.extend(range(start, start + 1000))
+    return keys[:n]
+
+
+def strided_keys(n):
+    return [i << 20 for i in range(n)]
+
+
+def get_latencies(table, keys):
+    for key in keys:
+        table.put(key, key)
+
+    lookups = keys[:]
+    random.shuffle(lookups)
+    latencies = []
+    for key in lookups:
+        start = perf_counter_ns()
+        table.get(key)
+        latencies.append(perf_counter_ns() - start)
+    return sorted(latencies)
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[int(fraction * (len(sorted_values) - 1))]
+
+
+if __name__ == "__main__":
+    # Optional argument: number of keys, e.g. "python cuckooBenchmark.py 100000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    # Every strided key lands on one probe chain, so loading HashTable is quadratic.
+    strided_n = min(n, 5000)
+
+    key_sets = [("random", random_keys(n)),
+                ("clustered", clustered_keys(n)),
+                ("strided", strided_keys(strided_n))]
+
+    print("{:>10} {:>16} {:>10} {:>10} {:>10} {:>10}".format(
+        "keys", "table", "p50 us", "p99 us", "p99.9 us", "max us"))
+    for name, keys in key_sets:
+        for table_name, table in (("HashTable", HashTable()), ("CuckooHashTable", CuckooHashTable())):
+            latencies = get_latencies(table, keys)
+            print("{:>10} {:>16} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f}".format(
+                name, table_name,
+                percentile(latencies, 0.5) / 1000,
+                percentile(latencies, 0.99) / 1000,
+                percentile(latencies, 0.999) / 1000,
+                latencies[-1] / 1000))
@@ -0,0 +1,278 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+'''
+import random
+
+BUCKET_SIZE = 4         # Slots per bucket.
+STASH_SIZE = 4          # Entries that found no bucket after MAX_KICKS evictions.
+MAX_KICKS = 500         # Evictions tried before an insert falls back to the stash.
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _mix(h, seed):
+    """
+        splitmix64 finalizer over hash(key) ^ seed. Spreads sequential and
+        strided keys (multiples of the table size) over every bucket.
+    """
+    z = (h ^ seed) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+class CuckooHashTable:
+    """
+        CuckooHashTable: Key-Value Map with constant worst-case lookups.
+        Operations:
+            put(key, value)
+            get(key)
+            delete(key)
+
+        Every key has exactly two candidate buckets of BUCKET_SIZE slots,
+        chosen by two independently seeded hash functions, plus a small
+        shared stash. get() looks at those places and nothing else, so it
+        never reads more than 2 * BUCKET_SIZE + STASH_SIZE slots however
+        the keys cluster. put() makes room by evicting ("kicking") a resident
+        to its other bucket; if that goes on too long the entry goes to the
+        stash, and when the stash is full the table is rebuilt with new seeds
+        (or twice the size when it is too full).
+    """
+
+    def __init__(self, capacity=16, max_load=0.9):
+        """
+            Define an empty cuckoo hashtable.
+            :param capacity: initial number of slots, rounded up to a power-of-two number of buckets.
+            :param max_load: fraction of slots that triggers doubling the table.
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+
+        buckets = 2
+        while buckets * BUCKET_SIZE < capacity:
+            buckets *= 2
+
+        self._max_load = max_load
+        self._random = random.Random()
+        self._count = 0
+        self._allocate(buckets)
+
+    def _allocate(self, buckets):
+        self._buckets = buckets
+        self._bits = buckets.bit_length() - 1
+        slots = buckets * BUCKET_SIZE
+        self._hashes = [None] * slots       #hash(key) of the resident, None for a free slot.
+        self._keys = [None] * slots
+        self._values = [None] * slots
+        self._stash = []                    #(hash, key, value) tuples.
+        self._seed1 = self._random.getrandbits(64)
+        self._seed2 = self._random.getrandbits(64)
+
+    def _bucket_starts(self, h):
+        """
+            First slot of each of the two candidate buckets. Uses the top bits
+            of the mixed hash, the best mixed ones.
+        """
+        shift = 64 - self._bits
+        return ((_mix(h, self._seed1) >> shift) * BUCKET_SIZE,
+                (_mix(h, self._seed2) >> shift) * BUCKET_SIZE)
+
+    def _findslot(self, key, h):
+        """
+            Find the slot of key in its two buckets.
+            :return: slot index, or -1 if the key is not in a bucket (it may be in the stash).
+        """
+        hashes = self._hashes
+        keys = self._keys
+        for start in self._bucket_starts(h):
+            for slot in range(start, start + BUCKET_SIZE):
+                if hashes[slot] == h and (keys[slot] is key or keys[slot] == key):
+                    return slot
+        return -1
+
+    def _find_stash(self, key, h):
+        for i, (entry_hash, entry_key, _) in enumerate(self._stash):
+            if entry_hash == h and (entry_key is key or entry_key == key):
+                return i
+        return -1
+
+    def get(self, key, default=None):
+        """
+            Return the value for a particular key.
+            :param key: key for which value is returned.
+            :param default: returned when the key is not in the table.
+            :return: value corresponding to the key.
+        """
+        h = hash(key)
+        slot = self._findslot(key, h)
+        if slot >= 0:
+            return self._values[slot]
+
+        if self._stash:
+            i = self._find_stash(key, h)
+            if i >= 0:
+                return self._stash[i][2]
+        return default
+
+    def put(self, key, value):
+        """
+            Add a key-value pair into the hash table.
+            :param key: key is item used to calculate the hash
+            :param value: Actual value stored in the slot.
+        """
+        h = hash(key)
+        slot = self._findslot(key, h)
+        if slot >= 0:
+            self._values[slot] = value
+            return
+
+        if self._stash:
+            i = self._find_stash(key, h)
+            if i >= 0:
+                self._stash[i] = (h, key, value)
+                return
+
+        if self._count + 1 > self._buckets * BUCKET_SIZE * self._max_load:
+            self._rebuild(self._buckets * 2)
+
+        kicked = []
+        leftover = self._place(h, key, value, kicked)
+        if leftover is not None:
+            if len(self._stash) < STASH_SIZE:
+                self._stash.append(leftover)
+            else:
+                try:
+                    self._rebuild(self._buckets, leftover)
+                except ValueError:
+                    # The table is back as it was before the rebuild; undo the evictions too.
+                    self._unplace(kicked, leftover)
+                    raise
+        self._count += 1
+
+    def _place(self, h, key, value, kicked=None):
+        """
+            Put an entry into one of its buckets, kicking residents around if
+            both are full.
+            :param kicked: if given, the slot of every eviction is appended to it.
+            :return: None, or the (hash, key, value) left homeless after MAX_KICKS evictions.
+        """
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+
+        for _ in range(MAX_KICKS):
+            starts = self._bucket_starts(h)
+            for start in starts:
+                for slot in range(start, start + BUCKET_SIZE):
+                    if hashes[slot] is None:
+                        hashes[slot], keys[slot], values[slot] = h, key, value
+                        return None
+
+            # Both buckets full: evict a random resident and send it to its other bucket.
+            slot = self._random.choice(starts) + self._random.randrange(BUCKET_SIZE)
+            if kicked is not None:
+                kicked.append(slot)
+            h, hashes[slot] = hashes[slot], h
+            key, keys[slot] = keys[slot], key
+            value, values[slot] = values[slot], value
+
+        return h, key, value
+
+    def _unplace(self, kicked, leftover):
+        """
+            Undo the evictions of a _place() call that returned leftover: the
+            swaps are replayed backwards, which puts every resident back.
+        """
+        h, key, value = leftover
+        for slot in reversed(kicked):
+            h, self._hashes[slot] = self._hashes[slot], h
+            key, self._keys[slot] = self._keys[slot], key
+            value, self._values[slot] = self._values[slot], value
+
+    def _rebuild(self, buckets, extra=None):
+        """
+            Re-insert everything (and the extra entry, if any) with fresh seeds
+            into a table of the given size, doubling again for as long as some
+            entries still do not fit.
+            :raises: ValueError if the entries cannot be placed; the table is then left as it was.
+        """
+        entries = [(h, self._keys[slot], self._values[slot])
+                   for slot, h in enumerate(self._hashes) if h is not None]
+        entries.extend(self._stash)
+        if extra is not None:
+            entries.append(extra)
+
+        old = (self._buckets, self._bits, self._hashes, self._keys, self._values,
+               self._stash, self._seed1, self._seed2)
+        while True:
+            self._allocate(buckets)
+            for entry in entries:
+                leftover = self._place(*entry)
+                if leftover is not None:
+                    if len(self._stash) == STASH_SIZE:
+                        break
+                    self._stash.append(leftover)
+            else:
+                return
+
+            if len(entries) < buckets * BUCKET_SIZE // 8:
+                # Plenty of room and still stuck: the keys share their hash() values.
+                (self._buckets, self._bits, self._hashes, self._keys, self._values,
+                 self._stash, self._seed1, self._seed2) = old
+                raise ValueError("too many keys with identical hash() values for a cuckoo table")
+            buckets *= 2
+
+    def delete(self, key):
+        """
+            Remove a key from the table.
+            :param key: key to remove.
+            :raises: KeyError if the key is not in the table.
+        """
+        h = hash(key)
+        slot = self._findslot(key, h)
+        if slot >= 0:
+            self._hashes[slot] = self._keys[slot] = self._values[slot] = None
+        else:
+            i = self._find_stash(key, h) if self._stash else -1
+            if i < 0:
+                raise KeyError(key)
+            del self._stash[i]
+        self._count -= 1
+
+    def __iter__(self):
+        for slot, h in enumerate(self._hashes):
+            if h is not None:
+                yield self._keys[slot], self._values[slot]
+        for _, key, value in self._stash:
+            yield key, value
+
+    @property
+    def utilization(self):
+        return float(self._count) / float(self._buckets * BUCKET_SIZE)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        h = hash(key)
+        return self._findslot(key, h) >= 0 or (bool(self._stash) and self._find_stash(key, h) >= 0)
+
+    def __len__(self):
+        return self._count
+
+
+if __name__ == "__main__":
+    c_t = CuckooHashTable()
+
+    for i in range(0, 1 << 20, 1 << 12):
+        c_t[i] = str(i)
+    c_t["name"] = "Marina"
+    del c_t[0]
+
+    print(len(c_t), c_t[4096], c_t["name"], 0 in c_t, "{:.2f}".format(c_t.utilization))
@@ -9,6 +9,20 @@ class EmptyDequeError(Exception):
     """
     pass
 
+BLOCKLEN = 64                       # Items per block.
+CENTER = (BLOCKLEN - 1) // 2        # Where an empty Deque starts, so it can grow both ways.
+
+class _Block:
+    """
+        One fixed-size chunk of the Deque, doubly linked to its neighbours.
+    """
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(self, prev=None, next=None):
+        self.data = [None] * BLOCKLEN
+        self.prev = prev
+        self.next = next
+
 class Deque:
     """
         Deque: Hybrid Data Structure.
@@ -17,30 +31,79 @@ class Deque:
             addRear(item)
             removeFront()
             removeRear()
+            extendFront(items)
+            extendRear(items)
+            rotate(k)
             isEmpty()
             size()
     """
 
-    def __init__(self):
+    def __init__(self, items=(), maxlen=None):
         """
             Define an empty Deque.
-            Here we are using list to implement the Deque data structure.
+            Items live in a chain of fixed-size blocks (the same layout as
+            CPython's collections.deque). Adding or removing at either end only
+            touches the outer block, and a new block is linked in or dropped
+            every BLOCKLEN operations, so all four end operations are O(1).
+            :param items: optional iterable added at the rear.
+            :param maxlen: optional bound, adding to a full Deque evicts from the opposite end.
         """
-        self._data = []
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be >= 0")
+
+        self._maxlen = maxlen
+        self._leftblock = self._rightblock = _Block()
+        self._leftindex = CENTER + 1     #Index of the front item in _leftblock.
+        self._rightindex = CENTER        #Index of the rear item in _rightblock.
+        self._size = 0
+
+        self.extendRear(items)
+
+    @property
+    def maxlen(self):
+        return self._maxlen
 
     def addFront(self, item):
         """
             Insert the item at the Front of the Deque
             :param item: item to be added on to the Deque
         """
-        self._data.insert(0, item)
+        if self._maxlen == 0:
+            return
+
+        if self._leftindex == 0:
+            block = _Block(next=self._leftblock)
+            self._leftblock.prev = block
+            self._leftblock = block
+            self._leftindex = BLOCKLEN
+
+        self._leftindex -= 1
+        self._leftblock.data[self._leftindex] = item
+        self._size += 1
+
+        if self._maxlen is not None and self._size > self._maxlen:
+            self.removeRear()
 
     def addRear(self, item):
         """
             Insert the item at the rear of the Deque
             :param item: item to be added on to the Deque
         """
-        self._data.append(item)
+        if self._maxlen == 0:
+            return
+
+        if self._rightindex == BLOCKLEN - 1:
+            block = _Block(prev=self._rightblock)
+            self._rightblock.next = block
+            self._rightblock = block
+            self._rightindex = -1
+
+        self._rightindex += 1
+        self._rightblock.data[self._rightindex] = item
+        self._size += 1
+
+        if self._maxlen is not None and self._size > self._maxlen:
+            self.removeFront()
 
     def removeFront(self):
         """
@@ -48,28 +111,134 @@ class Deque:
             :return: item removed from the front of the Deque.
             :raises: EmptyDequeError if Deque has no elements.
         """
-        if self.isEmpty():
+        if self._size == 0:
             raise EmptyDequeError("removeFront: Removing from an empty Deque")
 
-        return self._data.pop(0)
+        block = self._leftblock
+        item = block.data[self._leftindex]
+        block.data[self._leftindex] = None      # Drop the reference so the item can be collected.
+        self._leftindex += 1
+        self._size -= 1
+
+        if self._size == 0:
+            self._recenter()
+        elif self._leftindex == BLOCKLEN:
+            self._leftblock = block.next
+            self._leftblock.prev = None
+            self._leftindex = 0
+
+        return item
 
     def removeRear(self):
         """
             Removes an item from the rear of the Deque.
-            :return: item removed from the front of the Deque.
+            :return: item removed from the rear of the Deque.
             :raises: EmptyDequeError if Deque has no elements.
         """
-        if self.isEmpty():
-            raise EmptyDequeError("removeFront: Removing from an empty Deque")
+        if self._size == 0:
+            raise EmptyDequeError("removeRear: Removing from an empty Deque")
+
+        block = self._rightblock
+        item = block.data[self._rightindex]
+        block.data[self._rightindex] = None
+        self._rightindex -= 1
+        self._size -= 1
+
+        if self._size == 0:
+            self._recenter()
+        elif self._rightindex == -1:
+            self._rightblock = block.prev
+            self._rightblock.next = None
+            self._rightindex = BLOCKLEN - 1
+
+        return item
+
+    def extendFront(self, items):
+        """
+            Add every item at the front. Like deque.extendleft the items end up reversed.
+            :param items: iterable of items to be added on to the Deque
+        """
+        addFront = self.addFront
+        for item in items:
+            addFront(item)
 
-        return self._data.pop()
+    def extendRear(self, items):
+        """
+            Add every item at the rear, keeping their order.
+            :param items: iterable of items to be added on to the Deque
+        """
+        addRear = self.addRear
+        for item in items:
+            addRear(item)
+
+    def rotate(self, k=1):
+        """
+            Rotate the Deque k steps to the right (to the left if k is negative).
+            Rotating by one step moves the rear item to the front.
+            :param k: number of steps.
+        """
+        if self._size <= 1:
+            return
+
+        # Go the shorter way round, a rotation never needs more than size/2 moves.
+        k %= self._size
+        if k > self._size // 2:
+            k -= self._size
+
+        # The size does not change, so no maxlen eviction can kick in.
+        if k > 0:
+            for _ in range(k):
+                self.addFront(self.removeRear())
+        else:
+            for _ in range(-k):
+                self.addRear(self.removeFront())
+
+    def __getitem__(self, index):
+        """
+            Return the item at position index (negative counts from the rear).
+            Walks block by block from the nearer end, so it costs O(n / BLOCKLEN).
+            :raises: IndexError if index is out of range.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Deque index out of range")
+
+        block, offset = self._locate(index)
+        return block.data[offset]
+
+    def __setitem__(self, index, item):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Deque index out of range")
+
+        block, offset = self._locate(index)
+        block.data[offset] = item
+
+    def __iter__(self):
+        block = self._leftblock
+        start = self._leftindex
+        remaining = self._size
+        while remaining > 0:
+            stop = min(BLOCKLEN, start + remaining)
+            yield from block.data[start:stop]
+            remaining -= stop - start
+            block = block.next
+            start = 0
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
 
     def size(self):
         """
             Returns the number of elements currently in the Deque.
             :return: size of the Deque.
         """
-        return len(self._data)
+        return self._size
 
 
     def isEmpty(self):
@@ -77,7 +246,33 @@ class Deque:
             Test if the Deque has no items.
             :return: True if Deque is Empty. False Otherwise
         """
-        return self.size() == 0
+        return self._size == 0
+
+    def _locate(self, index):
+        """
+            Find the block and the offset inside it that hold logical position index.
+        """
+        position = self._leftindex + index
+        block_number = position // BLOCKLEN
+        last_block = (self._leftindex + self._size - 1) // BLOCKLEN
+
+        if block_number <= last_block - block_number:
+            block = self._leftblock
+            for _ in range(block_number):
+                block = block.next
+        else:
+            block = self._rightblock
+            for _ in range(last_block - block_number):
+                block = block.prev
+
+        return block, position % BLOCKLEN
+
+    def _recenter(self):
+        # An empty Deque keeps one block and restarts in the middle of it.
+        self._leftblock = self._rightblock
+        self._leftblock.prev = self._leftblock.next = None
+        self._leftindex = CENTER + 1
+        self._rightindex = CENTER
 
 
 
@@ -94,9 +289,17 @@ if __name__ == "__main__":
     while not q.isEmpty():
         print(q.removeFront())
 
+    d = Deque(range(10))
+    d.rotate(3)
+    print(d, d[0], d[-1])
+
+    window = Deque(maxlen=3)
+    window.extendRear(range(6))
+    print(window)
+
     import time
 
     time.sleep(1)  # To ensure the output from program and exception is not interleaved.
 
     # Try to remove from empty Deque.
-    #q.removeRear()
\ No newline at end of file
+    #q.removeRear()
@@ -0,0 +1,65 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Every Fibonacci implementation in the repo side by side, on growing n.
+The old ones print as they go (dynamicProgramming.fibonacci prints the
+lookup on every step, the @timed ones print every call), so their output
+goes to /dev/null while they are timed. A variant is skipped ("-") once n
+is past what it can do: the exponential recursions beyond n = 25, the
+recursive ones at the recursion limit, fibonacci2 (it keeps the whole
+list of big numbers) above 10**4 and the linear loops above 10**6.
+All results are checked against fastFibonacci.fib.
+'''
+import contextlib
+import os
+import sys
+from timeit import default_timer as timer
+
+from fastFibonacci import fib
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                             "1_FundamentaL_Of_Python", "_7_Scopes,Clousers,Decorators", "Decorators"))
+
+with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+    # Both modules print a few examples when they are imported.
+    import dynamicProgramming
+    import timerDecorator
+
+RECURSION = sys.getrecursionlimit() - 100
+
+# (name, function of n returning F(n) with F(1) = F(2) = 1, largest n it can do)
+VARIANTS = [
+    ("dynamicProgramming.fibonacci", lambda n: dynamicProgramming.fibonacci(n - 1, [None] * n), RECURSION),
+    ("dynamicProgramming.fibonacci1", lambda n: dynamicProgramming.fibonacci1(n - 1), 25),
+    ("dynamicProgramming.fibonacci2", lambda n: dynamicProgramming.fibonacci2(n - 1)[-1], 10 ** 4),
+    ("timerDecorator.recursive_fib", lambda n: timerDecorator.recursive_fib(n), 25),
+    ("timerDecorator.loop_fibonacci", lambda n: timerDecorator.loop_fibonacci(n), 10 ** 6),
+    ("timerDecorator.reduce_fibo", lambda n: timerDecorator.reduce_fibo(n - 1), 10 ** 6),
+    ("fastFibonacci.fib", fib, 10 ** 7),
+]
+
+
+def run(fn, n):
+    with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+        start = timer()
+        result = fn(n)
+        return timer() - start, result
+
+
+if __name__ == "__main__":
+    # Optional arguments: the values of n, e.g. "python fibonacciBenchmark.py 20 500 100000".
+    sizes = [int(arg) for arg in sys.argv[1:]] or [20, 25, 500, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+    print("{:>30}".format("n") + "".join("{:>10}".format(n) for n in sizes))
+    for name, fn, limit in VARIANTS:
+        row = []
+        for n in sizes:
+            if n > limit:
+                row.append("-")
+                continue
+            elapsed, result = run(fn, n)
+            assert result == fib(n), "{} is wrong for n = {}".format(name, n)
+            row.append("{:.4f}s".format(elapsed))
+        print("{:>30}".format(name) + "".join("{:>10}".format(cell) for cell in row))
@@ -2,6 +2,132 @@
 Created on 22 Dec 2019
 @author: M.Laptop
 '''
+from array import array
+
+# Key of a deleted entry. The entry keeps its hash, so the index slot that
+# points at it still has a known probe distance and lookups can walk past it.
+_DELETED = object()
+
+def _index_typecode(size):
+    """
+        Smallest signed array type that can hold every index into a table of this size.
+    """
+    for typecode, limit in (("b", 2 ** 7), ("h", 2 ** 15), ("i", 2 ** 31)):
+        if size <= limit:
+            return typecode
+    return "q"
+
+class _Table:
+    """
+        One open-addressing table in the compact layout CPython dicts use.
+        The sparse part is a small int array (index) of size slots holding
+        -1 for an empty slot or a position in the dense part. The dense part
+        is three parallel arrays, hashes, keys and values, filled in
+        insertion order, so a live entry costs a few bytes of index plus a
+        cached hash and two pointers instead of a tuple.
+        HashTable keeps one of these, or two while an incremental resize
+        is moving entries from the old one to the new one.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.mask = size - 1
+        self.index = array(_index_typecode(size), [-1]) * size
+        self.hashes = array("q")
+        self.keys = []
+        self.values = []
+
+    @property
+    def used(self):
+        """
+            Dense entries, live and deleted. Never more than the number of
+            used index slots, so it is a safe measure of the load.
+        """
+        return len(self.keys)
+
+    def find(self, key, h):
+        """
+            Find the dense entry holding key.
+            :param key: key we are trying to get.
+            :param h: hash(key).
+            :return: position in the dense arrays, or -1 if the key is not in the table.
+        """
+        index = self.index
+        hashes = self.hashes
+        keys = self.keys
+        mask = self.mask
+        slot = h & mask
+        dist = 0
+
+        while True:
+            ix = index[slot]
+            if ix < 0:
+                return -1
+            entry_hash = hashes[ix]
+            # Robin Hood invariant: had the key been here we would have
+            # displaced any entry closer to its home than we are now.
+            if dist > ((slot - entry_hash) & mask):
+                return -1
+            if entry_hash == h:
+                entry_key = keys[ix]
+                if entry_key is key or (entry_key is not _DELETED and entry_key == key):
+                    return ix
+
+            slot = (slot + 1) & mask
+            dist += 1
+
+    def insert(self, h, key, value):
+        """
+            Append a key that is known not to be in the table and link it into the index.
+        """
+        ix = len(self.keys)
+        self.hashes.append(h)
+        self.keys.append(key)
+        self.values.append(value)
+
+        index = self.index
+        hashes = self.hashes
+        keys = self.keys
+        mask = self.mask
+        slot = h & mask
+        dist = 0
+
+        while True:
+            resident = index[slot]
+            if resident < 0:
+                index[slot] = ix
+                return
+
+            resident_dist = (slot - hashes[resident]) & mask
+            if resident_dist < dist:
+                if keys[resident] is _DELETED:
+                    index[slot] = ix
+                    return
+                # Take from the rich: swap and carry the resident further.
+                index[slot] = ix
+                ix = resident
+                dist = resident_dist
+
+            slot = (slot + 1) & mask
+            dist += 1
+
+    def delete(self, ix):
+        self.keys[ix] = _DELETED
+        self.values[ix] = None
+
+    def copy_to(self, target, start, stop):
+        """
+            Insert the live dense entries start..stop-1 into another table.
+        """
+        insert = target.insert
+        hashes = self.hashes
+        keys = self.keys
+        values = self.values
+
+        for ix in range(start, stop):
+            key = keys[ix]
+            if key is not _DELETED:
+                insert(hashes[ix], key, values[ix])
 
 class HashTable:
     """
@@ -9,19 +135,124 @@ class HashTable:
         Operations:
             put(key, value)
             get(key)
+            delete(key)
+            from_items(items) / reserve(n)
+            keys() / values() / items()
+
+        Open addressing with linear probing and Robin Hood displacement:
+        an entry that is further from its home slot than the resident one
+        takes the slot, and the resident moves on. That evens out probe
+        lengths, so the table can run at high load (0.9) with short and
+        predictable probes. Iteration follows insertion order.
+
+        With incremental=True a resize does not rebuild the table in one
+        go. The old and the new table live side by side and every put, get
+        and delete first moves at most max_pause old entries across, the way
+        Redis rehashes its dicts, so no single call pays for the whole
+        rebuild. While that is running, keys added during the resize are
+        iterated before the ones still waiting in the old table.
     """
 
-    def __init__(self):
+    def __init__(self, capacity=8, max_load=0.75, incremental=False, max_pause=64):
         """
             Define an empty hashtable.
-            We use lists to implement an hash table.
+            We use an index array plus dense lists to implement an hash table.
+            :param capacity: initial number of slots, rounded up to a power of two.
+            :param max_load: fraction of used slots (live + deleted) that triggers a resize.
+            :param incremental: spread resizes over the following operations.
+            :param max_pause: old entries migrated per operation during an incremental resize.
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+        if max_pause < 1:
+            raise ValueError("max_pause must be >= 1")
+
+        size = 8
+        while size < capacity:
+            size *= 2
+
+        self._max_load = max_load
+        self._incremental = incremental
+        self._max_pause = max_pause
+        self._table = _Table(size)
+        self._old = None            #Table being drained by an incremental resize.
+        self._rehash_index = 0      #Old dense entries below this index are already migrated.
+        self._count = 0             #Live entries in both tables.
+
+
+    @classmethod
+    def from_items(cls, items, expected_size=None, **kwargs):
+        """
+            Build a table from key-value pairs, sizing it once up front.
+            The input is consumed one pair at a time, so a generator works
+            and is never held in memory.
+            :param items: iterable of (key, value) pairs, or a mapping.
+            :param expected_size: number of distinct keys expected. Taken from
+                                  len(items) when not given and items has a length.
+            :param kwargs: passed on to HashTable().
+            :return: new HashTable.
         """
-        self._size = 4
-        self._table = [None] * self._size
+        if hasattr(items, "items"):
+            items = items.items()
+        if expected_size is None:
+            try:
+                expected_size = len(items)
+            except TypeError:
+                expected_size = 0
 
+        table = cls(**kwargs)
+        table.reserve(expected_size)
+        table._load(items)
+        return table
+
+    def reserve(self, n):
+        """
+            Grow the table once so that n live keys fit without any further resize.
+            Never shrinks the table.
+            :param n: number of keys the table should hold.
+        """
+        size = self._table.size
+        while n > size * self._max_load:
+            size *= 2
+
+        if size > self._table.size:
+            self._resize(size, incremental=False)
+
+    def _load(self, items):
+        """
+            Bulk put. Same result as calling put() for every pair, but the
+            resize limit is computed once per table instead of on every insert.
+        """
+        if self._old is not None:
+            self._rehash_step(self._old.used)
+
+        table = self._table
+        limit = table.size * self._max_load
+        count = self._count
+
+        for key, value in items:
+            h = hash(key)
+            ix = table.find(key, h)
+            if ix >= 0:
+                table.values[ix] = value
+                continue
+
+            if table.used + 1 > limit:
+                self._count = count
+                self._resize(incremental=False)
+                table = self._table
+                limit = table.size * self._max_load
+
+            table.insert(h, key, value)
+            count += 1
+
+        self._count = count
 
     def hash_function(self, key):
-        return key % self._size
+        """
+            Home slot of the key. Works for any hashable key.
+        """
+        return hash(key) & self._table.mask
 
     def put(self, key, value):
         """
@@ -29,65 +260,198 @@ class HashTable:
             :param key: key is item used to calculate the hash
             :param value: Actual value stored in the slot.
         """
-        # If the table is 75% or more full, resize it to twice the current size.
-        if self.utilization >= 0.75:
-            self._resize()
+        if self._old is not None:
+            self._rehash_step(self._max_pause)
 
-        slot = self.hash_function(key)
+        h = hash(key)
+        table = self._table
+        ix = table.find(key, h)
+        if ix >= 0:
+            table.values[ix] = value
+            return
+
+        if self._old is not None:
+            ix = self._find_old(key, h)
+            if ix >= 0:
+                self._old.values[ix] = value
+                return
+
+        # If the table is max_load or more full, resize it before inserting.
+        if table.used + 1 > table.size * self._max_load:
+            self._resize()
 
-        # Do a linear probe until a slot is found in case of collision.
-        if self._table[slot] is not None and self._table[slot][0] != key:
-            slot = self._findslot(slot, key)
+        self._table.insert(h, key, value)
+        self._count += 1
 
-        self._table[slot] = (key, value)
 
-    
-    def get(self, key):
+    def get(self, key, default=None):
         """
             Return the value for a particular key.
             :param key: key for which value is returned.
+            :param default: returned when the key is not in the table.
             :return: value corresponding to the key.
         """
-        slot = self.hash_function(key)
+        if self._old is not None:
+            self._rehash_step(self._max_pause)
 
-        # Do a linear probe until a slot is found in case of collision.
-        if self._table[slot] is not None and self._table[slot][0] != key:
-            slot = self._findslot(slot, key)
+        h = hash(key)
+        ix = self._table.find(key, h)
+        if ix >= 0:
+            return self._table.values[ix]
 
-        return self._table[slot][1] if self._table[slot] is not None else None
+        if self._old is not None:
+            ix = self._find_old(key, h)
+            if ix >= 0:
+                return self._old.values[ix]
 
-    def _findslot(self, slot, key):
+        return default
+
+    def delete(self, key):
+        """
+            Remove a key from the table, leaving a tombstone in its slot.
+            :param key: key to remove.
+            :raises: KeyError if the key is not in the table.
+        """
+        if self._old is not None:
+            self._rehash_step(self._max_pause)
+
+        h = hash(key)
+        table = self._table
+        ix = table.find(key, h)
+        if ix < 0 and self._old is not None:
+            table = self._old
+            ix = self._find_old(key, h)
+        if ix < 0:
+            raise KeyError(key)
+
+        table.delete(ix)
+        self._count -= 1
+
+    def _find_old(self, key, h):
+        """
+            Look the key up in the table being drained. Dense entries below
+            _rehash_index were already copied to the new table.
+        """
+        ix = self._old.find(key, h)
+        return ix if ix >= self._rehash_index else -1
+
+    def _resize(self, size=None, incremental=None):
+        """
+            Move to a new table twice the size, or the same size when most of
+            the used slots were deleted entries. Deleted entries are not carried over.
+            Stop-the-world mode copies everything now, incremental mode only
+            swaps the tables and lets _rehash_step do the copying.
+            :param size: explicit new size instead of the doubling rule.
+            :param incremental: override the table's resize mode for this resize.
+        """
+        if self._old is not None:
+            # The new table filled up before the last resize finished: finish it first.
+            self._rehash_step(self._old.used)
+
+        old = self._table
+        if size is None:
+            size = old.size * 2 if self._count * 2 >= old.used else old.size
+        new = _Table(size)
+
+        if self._incremental if incremental is None else incremental:
+            self._table = new
+            self._old = old
+            self._rehash_index = 0
+        else:
+            # Fill the new table before swapping it in, so the table is never half built.
+            old.copy_to(new, 0, old.used)
+            self._table = new
+
+    def _rehash_step(self, n):
         """
-            Determine the next slot where the key would fit in case of collision.
-            :param slot: Current slot that resulted in collision.
-            :param key: key we are trying to put/get.
-            :return: next slot where the key would fit.
+            Copy the next n old dense entries, if still live, into the new table.
         """
-        next_slot = self.hash_function(slot + 1)
+        old = self._old
+        stop = min(self._rehash_index + n, old.used)
+        old.copy_to(self._table, self._rehash_index, stop)
 
-        while self._table[next_slot] is not None and self._table[next_slot][0] != key:
-            next_slot = self.hash_function(next_slot + 1)
+        self._rehash_index = stop
+        if stop == old.used:
+            self._old = None
+            self._rehash_index = 0
 
-        return next_slot
+    @property
+    def rehash_progress(self):
+        """
+            Fraction of the old table already migrated, 1.0 when no resize is running.
+        """
+        if self._old is None:
+            return 1.0
+        return self._rehash_index / self._old.used
+
+    @property
+    def is_rehashing(self):
+        return self._old is not None
+
+    @property
+    def max_pause(self):
+        return self._max_pause
 
-    def _resize(self):
+    @max_pause.setter
+    def max_pause(self, value):
+        if value < 1:
+            raise ValueError("max_pause must be >= 1")
+        self._max_pause = value
+
+    def _live_entries(self):
+        """
+            Yield (key, value) for every live entry.
         """
-            Resize the table to twice its current size.
+        tables = [(self._table, 0)]
+        if self._old is not None:
+            tables.append((self._old, self._rehash_index))
+
+        for table, start in tables:
+            values = table.values
+            for ix in range(start, table.used):
+                key = table.keys[ix]
+                if key is not _DELETED:
+                    yield key, values[ix]
+
+    def probe_stats(self):
         """
-        self._size = self._size * 2
-        old_table = self._table
-        self._table = [None] * self._size
+            Distance of the live entries from their home slots.
+            :return: dict with mean, p99 and max probe length.
+        """
+        lengths = []
+        tables = [(self._table, 0)]
+        if self._old is not None:
+            tables.append((self._old, self._rehash_index))
+
+        for table, start in tables:
+            mask = table.mask
+            lengths.extend(((slot - table.hashes[ix]) & mask)
+                           for slot, ix in enumerate(table.index)
+                           if ix >= start and table.keys[ix] is not _DELETED)
+
+        if not lengths:
+            return {"mean": 0.0, "p99": 0, "max": 0}
 
-        for item in old_table:
-            if item is not None:
-                self.put(item[0], item[1])
+        lengths.sort()
+        return {"mean": sum(lengths) / len(lengths),
+                "p99": lengths[int(0.99 * (len(lengths) - 1))],
+                "max": lengths[-1]}
+
+    def keys(self):
+        return _KeysView(self)
+
+    def values(self):
+        return _ValuesView(self)
+
+    def items(self):
+        return _ItemsView(self)
 
     def __iter__(self):
-        return iter([(item[0], item[1]) for item in self._table if item is not None])
+        return self._live_entries()
 
     @property
     def utilization(self):
-        return float(len(self)) / float(self._size)
+        return float(self._count) / float(self._table.size)
 
     def __setitem__(self, key, value):
         self.put(key, value)
@@ -95,9 +459,54 @@ class HashTable:
     def __getitem__(self, key):
         return self.get(key)
 
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        h = hash(key)
+        if self._table.find(key, h) >= 0:
+            return True
+        return self._old is not None and self._find_old(key, h) >= 0
+
+    def __len__(self):
+        return self._count
+
+class _TableView:
+    """
+        Live, read-only view over a HashTable, like dict.keys()/values()/items().
+    """
+
+    def __init__(self, table):
+        self._hashtable = table
+
     def __len__(self):
-        return len([k for k in self._table if k is not None])
-    '''
+        return len(self._hashtable)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
+
+class _KeysView(_TableView):
+
+    def __iter__(self):
+        return (key for key, _ in self._hashtable._live_entries())
+
+    def __contains__(self, key):
+        return key in self._hashtable
+
+class _ValuesView(_TableView):
+
+    def __iter__(self):
+        return (value for _, value in self._hashtable._live_entries())
+
+class _ItemsView(_TableView):
+
+    def __iter__(self):
+        return self._hashtable._live_entries()
+
+    def __contains__(self, item):
+        key, value = item
+        return key in self._hashtable and self._hashtable.get(key) == value
+
 
 if __name__ == "__main__":
     h_t = HashTable()
@@ -107,11 +516,17 @@ if __name__ == "__main__":
     h_t[21] = "21"
     h_t[35] = "35"
     h_t[26] = "26"
-    h_t[34] = "34"
-    h_t[89] = "89"
+    h_t["34"] = "34"
+    h_t[(8, 9)] = "89"
+
+    del h_t[21]
 
     for k, v in h_t:
         print(k, v)
-        
-    print(h_t._size)
-'''
\ No newline at end of file
+
+    print(h_t._table.size, len(h_t), 35 in h_t, list(h_t.keys()))
+
+    inc = HashTable(incremental=True, max_pause=2)
+    for i in range(7):
+        inc[i] = i * i
+    print(inc.is_rehashing, inc.rehash_progress, inc[3])
@@ -0,0 +1,53 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Time to load N rows from a generator into a table: dict, HashTable with
+one put() per row, and HashTable.from_items() with and without a size hint.
+'''
+import sys
+from timeit import default_timer as timer
+
+from hashTableInplementation import HashTable
+
+
+def rows(n):
+    # Stands in for reading an extract: keys are strings, nothing is kept in memory.
+    for i in range(n):
+        yield "row-{}".format(i), i
+
+
+def load_dict(n):
+    return dict(rows(n))
+
+
+def load_put(n):
+    table = HashTable()
+    for key, value in rows(n):
+        table.put(key, value)
+    return table
+
+
+def load_from_items(n):
+    return HashTable.from_items(rows(n))
+
+
+def load_from_items_presized(n):
+    return HashTable.from_items(rows(n), expected_size=n)
+
+
+if __name__ == "__main__":
+    # Optional argument: number of rows, e.g. "python hashTableLoadBenchmark.py 5000000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+
+    loaders = [("dict", load_dict),
+               ("HashTable.put", load_put),
+               ("HashTable.from_items", load_from_items),
+               ("HashTable.from_items(expected_size=n)", load_from_items_presized)]
+
+    print("Loading {} rows".format(n))
+    for name, load in loaders:
+        start = timer()
+        load(n)
+        print("{:>40}: {:.3f}s".format(name, timer() - start))
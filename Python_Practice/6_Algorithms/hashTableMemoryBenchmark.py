@@ -0,0 +1,90 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Bytes per entry of the compact HashTable against the previous layout
+(one (hash, key, value) tuple per slot in a sparse list) and dict.
+Keys and values are created before measuring, so only the table's own
+memory is counted.
+'''
+import sys
+import tracemalloc
+
+from hashTableInplementation import HashTable
+
+
+class TupleSlotTable:
+    """
+        The previous HashTable storage: a sparse list of (hash, key, value)
+        tuples with linear probing, doubled at 75% load. Insert only,
+        kept here as the memory baseline.
+    """
+
+    def __init__(self):
+        self._size = 8
+        self._count = 0
+        self._slots = [None] * self._size
+
+    def put(self, key, value):
+        if self._count + 1 > self._size * 0.75:
+            old = self._slots
+            self._size *= 2
+            self._count = 0
+            self._slots = [None] * self._size
+            for entry in old:
+                if entry is not None:
+                    self.put(entry[1], entry[2])
+
+        h = hash(key)
+        mask = self._size - 1
+        slot = h & mask
+        while self._slots[slot] is not None and self._slots[slot][1] != key:
+            slot = (slot + 1) & mask
+        if self._slots[slot] is None:
+            self._count += 1
+        self._slots[slot] = (h, key, value)
+
+
+def bytes_per_entry(build, keys):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = build(keys)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del table
+    return (after - before) / len(keys)
+
+
+def build_tuple_slots(keys):
+    table = TupleSlotTable()
+    for key in keys:
+        table.put(key, key)
+    return table
+
+
+def build_compact(keys):
+    table = HashTable()
+    for key in keys:
+        table.put(key, key)
+    return table
+
+
+def build_dict(keys):
+    return {key: key for key in keys}
+
+
+if __name__ == "__main__":
+    # Optional argument: number of keys, e.g. "python hashTableMemoryBenchmark.py 100000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+
+    key_sets = [("int", list(range(n))),
+                ("str", ["name-{}".format(i) for i in range(n)])]
+
+    print("{:>6} {:>16} {:>16} {:>16}".format("keys", "tuple slots", "compact", "dict"))
+    for name, keys in key_sets:
+        print("{:>6} {:>16.1f} {:>16.1f} {:>16.1f}".format(
+            name,
+            bytes_per_entry(build_tuple_slots, keys),
+            bytes_per_entry(build_compact, keys),
+            bytes_per_entry(build_dict, keys)))
@@ -0,0 +1,58 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Latency of single put() calls while a HashTable grows from empty to N keys,
+stop-the-world resize against incremental resize. Every put is timed on
+its own and the timings are bucketed into a power-of-two histogram.
+'''
+import sys
+from time import perf_counter_ns
+
+from hashTableInplementation import HashTable
+
+
+def put_latencies(table, n):
+    latencies = []
+    for key in range(n):
+        start = perf_counter_ns()
+        table.put(key, key)
+        latencies.append(perf_counter_ns() - start)
+    return latencies
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[int(fraction * (len(sorted_values) - 1))]
+
+
+def print_report(name, latencies):
+    latencies = sorted(latencies)
+    print("{}: p50 {:.1f}us  p99 {:.1f}us  p99.9 {:.1f}us  max {:.1f}us  total {:.3f}s".format(
+        name,
+        percentile(latencies, 0.5) / 1000,
+        percentile(latencies, 0.99) / 1000,
+        percentile(latencies, 0.999) / 1000,
+        latencies[-1] / 1000,
+        sum(latencies) / 1e9))
+
+    # Bucket upper bounds 1us, 2us, 4us, ... in nanoseconds.
+    histogram = {}
+    for latency in latencies:
+        bound = 1000
+        while latency > bound:
+            bound *= 2
+        histogram[bound] = histogram.get(bound, 0) + 1
+
+    for bound in sorted(histogram):
+        print("    <= {:>10.0f}us {:>10}".format(bound / 1000, histogram[bound]))
+
+
+if __name__ == "__main__":
+    # Optional arguments: number of keys and max_pause, e.g. "python hashTableResizeBenchmark.py 1000000 128".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    max_pause = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    print_report("stop-the-world", put_latencies(HashTable(), n))
+    print_report("incremental (max_pause={})".format(max_pause),
+                 put_latencies(HashTable(incremental=True, max_pause=max_pause), n))
@@ -0,0 +1,180 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+In-place introsort, the replacement for the quicksort functions in
+quickSort1.py and sorting.py: those copy the list into new less/greater
+lists on every call and always pivot on array[0], so sorted input costs
+O(n**2) and runs into the recursion limit.
+
+- pivot: median of three, or Tukey's ninther (median of three medians)
+  for partitions over NINTHER items
+- three-way partition (< pivot, == pivot, > pivot), so runs of equal
+  items are finished in one pass instead of being split again and again
+- partitions of SMALL items or fewer are done by insertion sort
+- the partitions still to do are kept on an explicit stack instead of
+  recursion; the bigger half is pushed and the smaller one done first,
+  so the stack never holds more than log2(n) entries
+- a partition that is split more than 2 * log2(n) times in a row (bad
+  pivots) is finished by heapsort, which keeps the worst case O(n log n)
+
+Only "<" is used to compare items, like list.sort.
+'''
+
+SMALL = 16
+NINTHER = 40
+
+
+def _insertion_sort(array, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        item = array[i]
+        j = i - 1
+        while j >= lo and item < array[j]:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = item
+
+
+def _median3(array, i, j, k):
+    ''' index of the median of array[i], array[j], array[k] '''
+    a, b, c = array[i], array[j], array[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def _pivot(array, lo, hi):
+    mid = (lo + hi) // 2
+    if hi - lo < NINTHER:
+        return array[_median3(array, lo, mid, hi)]
+    step = (hi - lo) // 8
+    return array[_median3(array,
+                          _median3(array, lo, lo + step, lo + 2 * step),
+                          _median3(array, mid - step, mid, mid + step),
+                          _median3(array, hi - 2 * step, hi - step, hi))]
+
+
+def _partition3(array, lo, hi, pivot):
+    ''' rearrange array[lo..hi] into < pivot, == pivot, > pivot (Dijkstra's
+        Dutch national flag) and return the first and last index of the middle part
+    '''
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        item = array[i]
+        if item < pivot:
+            array[i] = array[lt]
+            array[lt] = item
+            lt += 1
+            i += 1
+        elif pivot < item:
+            array[i] = array[gt]
+            array[gt] = item
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _sift_down(array, lo, root, end):
+    ''' restore the max-heap below root; the heap is array[lo..end], children of i are 2i+1, 2i+2 (relative to lo) '''
+    item = array[lo + root]
+    while True:
+        child = 2 * root + 1
+        if lo + child > end:
+            break
+        if lo + child + 1 <= end and array[lo + child] < array[lo + child + 1]:
+            child += 1
+        if not item < array[lo + child]:
+            break
+        array[lo + root] = array[lo + child]
+        root = child
+    array[lo + root] = item
+
+
+def _heapsort(array, lo, hi):
+    size = hi - lo + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(array, lo, root, hi)
+    for end in range(hi, lo, -1):
+        array[lo], array[end] = array[end], array[lo]
+        _sift_down(array, lo, 0, end - 1)
+
+
+def _with_key(array, key, work):
+    ''' run work(array) with every item replaced by (key(item), index, item),
+        then put the items back; the index makes the order stable and means
+        items themselves are never compared.
+        All keys are computed before the list is touched, and if work
+        raises (keys that cannot be compared) the list is restored as it was.
+    '''
+    entries = [(key(item), i, item) for i, item in enumerate(array)]
+    array[:] = entries
+    try:
+        work(array)
+    except BaseException:
+        array[:] = [entry[2] for entry in entries]
+        raise
+    array[:] = [entry[2] for entry in array]
+
+
+def introsort(array, key=None):
+    ''' sort array in place, returns None like list.sort
+        key= sorts (key(item), index, item) entries in place of the items,
+        see _with_key; on an error the list is left unchanged
+    '''
+    if key is not None:
+        _with_key(array, key, introsort)
+        return
+
+    n = len(array)
+    if n < 2:
+        return
+
+    stack = [(0, n - 1, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= SMALL:
+            if depth == 0:
+                _heapsort(array, lo, hi)
+                break
+            depth -= 1
+            lt, gt = _partition3(array, lo, hi, _pivot(array, lo, hi))
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi, depth))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1, depth))
+                lo = gt + 1
+        else:
+            _insertion_sort(array, lo, hi)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    from timeit import default_timer as timer
+
+    array = [10, 5, 2, 3, 6, 3, 10, 5, 2, 3, 6, 3, 10, 5, 2, 3, 6, 3]
+    introsort(array)
+    print(array)
+
+    names = ["Marina", "Wiesia", "Frania", "Ziuta", "Marek"]
+    introsort(names, key=len)
+    print(names)
+
+    # Optional argument: number of items, e.g. "python introSort.py 10000000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    inputs = [("random", [random.random() for _ in range(n)]),
+              ("sorted", list(range(n))),
+              ("reversed", list(range(n, 0, -1))),
+              ("few distinct", [random.randrange(10) for _ in range(n)])]
+    for label, data in inputs:
+        expected = sorted(data)
+        start = timer()
+        introsort(data)
+        print("{:>13}: {:.2f}s".format(label, timer() - start), data == expected)
@@ -0,0 +1,357 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+'''
+import mmap
+import os
+import struct
+from hashlib import blake2b
+
+# File layout:
+#   header   HEADER_SIZE bytes, see _HEADER
+#   slots    slot_count * 16 bytes, each (hash int64, record offset uint64)
+#   heap     append-only records: key tag, value tag, key length, value length, key, value
+_MAGIC = b"PYHTBL01"
+_HEADER = struct.Struct("<8sQQQQ")      # magic, slot_count, count, used, heap_end
+HEADER_SIZE = 64
+_SLOT = struct.Struct("<qQ")
+_RECORD = struct.Struct("<BBII")
+
+_EMPTY = 0              # Record offset of a never used slot.
+_DELETED = 1            # Record offset of a tombstone, the slot keeps its hash.
+
+_BYTES = 0
+_STR = 1
+
+def _encode(item):
+    """
+        Turn a key or value into (tag, bytes). Only str and bytes-like items can be stored.
+    """
+    if isinstance(item, str):
+        return _STR, item.encode("utf-8")
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return _BYTES, bytes(item)
+    raise TypeError("MmapHashTable stores str or bytes, not {}".format(type(item).__name__))
+
+def _decode(tag, data):
+    return data.decode("utf-8") if tag == _STR else data
+
+def _stable_hash(tag, data):
+    """
+        hash() of str and bytes changes from process to process, so the file
+        uses its own 64 bit hash.
+    """
+    digest = blake2b(data, digest_size=8, person=bytes([tag])).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+class MmapHashTable:
+    """
+        MmapHashTable: on-disk Key-Value Map for str/bytes keys and values.
+        Operations:
+            put(key, value)
+            get(key)
+            delete(key)
+            flush() / close()
+
+        The same Robin Hood open addressing as HashTable, but the slots are
+        fixed-width records in a memory-mapped file and keys and values live
+        in an append-only heap after them. Opening a table only maps the
+        file, lookups read straight from the page cache, so a multi-GB table
+        is ready at once and mode "r" maps can be shared by any number of
+        reader processes. Overwritten and deleted records stay in the heap
+        until the next resize rewrites the file.
+        A writer must not run while other processes have the file open.
+    """
+
+    def __init__(self, path, mode="r", capacity=1024, max_load=0.75):
+        """
+            Open or create a table file.
+            :param path: file name.
+            :param mode: "r" read-only, "w" create (truncate an existing file), "a" read-write, create if missing.
+            :param capacity: initial number of slots for a new file, rounded up to a power of two.
+            :param max_load: fraction of used slots (live + tombstones) that triggers a resize.
+        """
+        if mode not in ("r", "w", "a"):
+            raise ValueError("mode must be 'r', 'w' or 'a'")
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+
+        self._path = path
+        self._readonly = mode == "r"
+        self._max_load = max_load
+
+        if mode == "w" or (mode == "a" and not os.path.exists(path)):
+            size = 8
+            while size < capacity:
+                size *= 2
+            self._create(path, size)
+
+        self._map()
+
+    def _create(self, path, slot_count):
+        heap_start = HEADER_SIZE + slot_count * _SLOT.size
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, slot_count, 0, 0, heap_start))
+            f.truncate(heap_start)
+
+    def _map(self):
+        self._file = open(self._path, "rb" if self._readonly else "r+b")
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+
+        magic, slot_count, count, used, heap_end = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError("{} is not a MmapHashTable file".format(self._path))
+
+        self._size = slot_count
+        self._mask = slot_count - 1
+        self._count = count
+        self._used = used
+        self._heap_end = heap_end
+
+    def _unmap(self):
+        self._mm.close()
+        self._file.close()
+
+    def _write_header(self):
+        _HEADER.pack_into(self._mm, 0, _MAGIC, self._size, self._count, self._used, self._heap_end)
+
+    def _check_writable(self):
+        if self._readonly:
+            raise PermissionError("MmapHashTable opened read-only")
+
+    def _slot_pos(self, slot):
+        return HEADER_SIZE + slot * _SLOT.size
+
+    def _findslot(self, h, tag, data):
+        """
+            Find the slot whose record holds the encoded key.
+            :return: slot index, or -1 if the key is not in the table.
+        """
+        mm = self._mm
+        mask = self._mask
+        slot = h & mask
+        dist = 0
+
+        while True:
+            entry_hash, offset = _SLOT.unpack_from(mm, self._slot_pos(slot))
+            if offset == _EMPTY:
+                return -1
+            # Robin Hood invariant: had the key been here we would have
+            # displaced any entry closer to its home than we are now.
+            if dist > ((slot - entry_hash) & mask):
+                return -1
+            if entry_hash == h and offset != _DELETED:
+                key_tag, _, key_len, _ = _RECORD.unpack_from(mm, offset)
+                start = offset + _RECORD.size
+                if key_tag == tag and key_len == len(data) and mm[start:start + key_len] == data:
+                    return slot
+
+            slot = (slot + 1) & mask
+            dist += 1
+
+    def _insert(self, h, offset):
+        """
+            Link a heap record whose key is known not to be in the table.
+        """
+        mm = self._mm
+        mask = self._mask
+        slot = h & mask
+        dist = 0
+
+        while True:
+            pos = self._slot_pos(slot)
+            resident_hash, resident_offset = _SLOT.unpack_from(mm, pos)
+            if resident_offset == _EMPTY:
+                _SLOT.pack_into(mm, pos, h, offset)
+                self._used += 1
+                return
+
+            resident_dist = (slot - resident_hash) & mask
+            if resident_dist < dist:
+                _SLOT.pack_into(mm, pos, h, offset)
+                if resident_offset == _DELETED:
+                    return
+                # Take from the rich: carry the resident further.
+                h, offset, dist = resident_hash, resident_offset, resident_dist
+
+            slot = (slot + 1) & mask
+            dist += 1
+
+    def _append_record(self, key_tag, key_data, value_tag, value_data):
+        """
+            Write a record at the end of the heap, growing the file if needed.
+            :return: offset of the record.
+        """
+        length = _RECORD.size + len(key_data) + len(value_data)
+        offset = self._heap_end
+        if offset + length > len(self._mm):
+            self._mm.resize(max(len(self._mm) * 2, offset + length))
+
+        _RECORD.pack_into(self._mm, offset, key_tag, value_tag, len(key_data), len(value_data))
+        start = offset + _RECORD.size
+        self._mm[start:start + len(key_data)] = key_data
+        start += len(key_data)
+        self._mm[start:start + len(value_data)] = value_data
+
+        self._heap_end = offset + length
+        return offset
+
+    def _read_record(self, offset):
+        key_tag, value_tag, key_len, value_len = _RECORD.unpack_from(self._mm, offset)
+        start = offset + _RECORD.size
+        key = _decode(key_tag, self._mm[start:start + key_len])
+        start += key_len
+        return key, _decode(value_tag, self._mm[start:start + value_len])
+
+    def put(self, key, value):
+        """
+            Add a key-value pair into the table. A new record is appended to
+            the heap even when the key exists, the slot is pointed at it.
+            :param key: str or bytes key.
+            :param value: str or bytes value.
+        """
+        self._check_writable()
+        key_tag, key_data = _encode(key)
+        value_tag, value_data = _encode(value)
+        h = _stable_hash(key_tag, key_data)
+
+        slot = self._findslot(h, key_tag, key_data)
+        if slot < 0 and self._used + 1 > self._size * self._max_load:
+            self._resize()
+
+        offset = self._append_record(key_tag, key_data, value_tag, value_data)
+        if slot >= 0:
+            _SLOT.pack_into(self._mm, self._slot_pos(slot), h, offset)
+        else:
+            self._insert(h, offset)
+            self._count += 1
+        self._write_header()
+
+    def get(self, key, default=None):
+        """
+            Return the value for a particular key.
+            :param key: key for which value is returned.
+            :param default: returned when the key is not in the table.
+            :return: value corresponding to the key.
+        """
+        key_tag, key_data = _encode(key)
+        slot = self._findslot(_stable_hash(key_tag, key_data), key_tag, key_data)
+        if slot < 0:
+            return default
+
+        _, offset = _SLOT.unpack_from(self._mm, self._slot_pos(slot))
+        return self._read_record(offset)[1]
+
+    def delete(self, key):
+        """
+            Remove a key from the table, leaving a tombstone in its slot.
+            :param key: key to remove.
+            :raises: KeyError if the key is not in the table.
+        """
+        self._check_writable()
+        key_tag, key_data = _encode(key)
+        h = _stable_hash(key_tag, key_data)
+        slot = self._findslot(h, key_tag, key_data)
+        if slot < 0:
+            raise KeyError(key)
+
+        _SLOT.pack_into(self._mm, self._slot_pos(slot), h, _DELETED)
+        self._count -= 1
+        self._write_header()
+
+    def _resize(self):
+        """
+            Rewrite the file with twice the slots (or the same number when most
+            used slots were tombstones), copying only live records, then swap
+            it in. Dead records in the heap are dropped on the way.
+        """
+        size = self._size * 2 if self._count * 2 >= self._used else self._size
+        tmp_path = self._path + ".resize"
+
+        new = MmapHashTable(tmp_path, mode="w", capacity=size, max_load=self._max_load)
+        try:
+            mm = self._mm
+            for slot in range(self._size):
+                h, offset = _SLOT.unpack_from(mm, self._slot_pos(slot))
+                if offset in (_EMPTY, _DELETED):
+                    continue
+                key_tag, value_tag, key_len, value_len = _RECORD.unpack_from(mm, offset)
+                start = offset + _RECORD.size
+                record_end = start + key_len + value_len
+                new._insert(h, new._append_record(key_tag, mm[start:start + key_len],
+                                                  value_tag, mm[start + key_len:record_end]))
+                new._count += 1
+            new._write_header()
+        finally:
+            new.close()
+
+        self._unmap()
+        os.replace(tmp_path, self._path)
+        self._map()
+
+    def flush(self):
+        """
+            Write dirty pages back to the file.
+        """
+        if not self._readonly:
+            self._mm.flush()
+
+    def close(self):
+        """
+            Flush and unmap the file. The table cannot be used afterwards.
+        """
+        if self._mm.closed:
+            return
+        if not self._readonly:
+            # Trim the spare capacity left by geometric growth.
+            self._mm.flush()
+            self._mm.resize(self._heap_end)
+        self._unmap()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self):
+        mm = self._mm
+        for slot in range(self._size):
+            _, offset = _SLOT.unpack_from(mm, self._slot_pos(slot))
+            if offset not in (_EMPTY, _DELETED):
+                yield self._read_record(offset)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        key_tag, key_data = _encode(key)
+        return self._findslot(_stable_hash(key_tag, key_data), key_tag, key_data) >= 0
+
+    def __len__(self):
+        return self._count
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "phonebook.tbl")
+
+    with MmapHashTable(path, mode="w", capacity=8) as m_t:
+        for i in range(20):
+            m_t["name-{}".format(i)] = "{:03d}".format(i)
+        m_t["name-3"] = b"\x00\x01"
+        del m_t["name-4"]
+
+    # A new process would do just this: map the file and read.
+    with MmapHashTable(path) as reader:
+        print(len(reader), reader["name-3"], reader["name-19"], "name-4" in reader)
+        print(os.path.getsize(path), "bytes on disk")
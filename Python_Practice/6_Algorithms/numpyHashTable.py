@@ -0,0 +1,225 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+'''
+import numpy as np
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+class Int64HashTable:
+    """
+        Int64HashTable: int64 keys to int64 or float64 values, stored in NumPy arrays.
+        Operations:
+            put_batch(keys, values)
+            get_batch(keys, default)
+            put(key, value)
+            get(key)
+
+        Open addressing with linear probing like HashTable, but a batch of
+        keys is probed together: each pass looks at one slot for every key
+        that is still unresolved, as a handful of array operations, so the
+        interpreter cost is per probe step, not per key. Keys go through
+        Fibonacci hashing (multiply by 2**64 / phi, keep the top bits),
+        which spreads sequential and strided ids over the table.
+    """
+
+    def __init__(self, capacity=1024, value_dtype=np.int64, max_load=0.5):
+        """
+            Define an empty table.
+            :param capacity: initial number of slots, rounded up to a power of two.
+            :param value_dtype: np.int64 or np.float64.
+            :param max_load: fraction of slots in use that triggers a resize.
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+
+        size = 8
+        while size < capacity:
+            size *= 2
+
+        self._value_dtype = np.dtype(value_dtype)
+        self._max_load = max_load
+        self._count = 0
+        self._allocate(size)
+
+    def _allocate(self, size):
+        self._size = size
+        self._mask = size - 1
+        self._shift = np.uint64(64 - (size.bit_length() - 1))
+        self._keys = np.zeros(size, dtype=np.int64)
+        self._values = np.zeros(size, dtype=self._value_dtype)
+        self._occupied = np.zeros(size, dtype=bool)
+
+    def _home(self, keys):
+        """
+            Home slot of every key, as an int64 array.
+        """
+        return ((keys.view(np.uint64) * _GOLDEN) >> self._shift).astype(np.int64)
+
+    def get_batch(self, keys, default=0):
+        """
+            Look up many keys at once.
+            :param keys: array-like of int64 keys.
+            :param default: value returned for keys that are not in the table.
+            :return: array of values, same length as keys.
+        """
+        keys = np.ascontiguousarray(keys, dtype=np.int64)
+        result = np.full(keys.shape[0], default, dtype=self._value_dtype)
+
+        slots = self._home(keys)
+        pending = np.arange(keys.shape[0])
+
+        while pending.size:
+            current = slots[pending]
+            occupied = self._occupied[current]
+            found = occupied & (self._keys[current] == keys[pending])
+            result[pending[found]] = self._values[current[found]]
+
+            # An empty slot ends the probe: the key is missing.
+            go_on = occupied & ~found
+            pending = pending[go_on]
+            slots[pending] = (current[go_on] + 1) & self._mask
+
+        return result
+
+    def put_batch(self, keys, values):
+        """
+            Insert or update many pairs at once. If a key repeats inside the
+            batch the last value wins, like a sequence of put() calls.
+            :param keys: array-like of int64 keys.
+            :param values: array-like of values, same length as keys.
+        """
+        keys = np.ascontiguousarray(keys, dtype=np.int64)
+        values = np.ascontiguousarray(values, dtype=self._value_dtype)
+        if keys.shape != values.shape:
+            raise ValueError("keys and values must have the same length")
+
+        # Keep the last occurrence of every key: unique() on the reversed batch keeps the first.
+        _, last = np.unique(keys[::-1], return_index=True)
+        if last.size != keys.size:
+            last = keys.size - 1 - last
+            keys = keys[last]
+            values = values[last]
+
+        # Worst case every key is new: grow once for the whole batch.
+        needed = self._count + keys.size
+        if needed > self._size * self._max_load:
+            size = self._size
+            while needed > size * self._max_load:
+                size *= 2
+            self._resize(size)
+
+        self._insert(keys, values)
+
+    def _insert(self, keys, values):
+        """
+            Probe all distinct keys together. A key stops when it finds itself
+            (update) or claims an empty slot; when several keys reach the same
+            empty slot in one pass the first one gets it and the rest probe on.
+        """
+        slots = self._home(keys)
+        pending = np.arange(keys.shape[0])
+
+        while pending.size:
+            current = slots[pending]
+            occupied = self._occupied[current]
+            same = occupied & (self._keys[current] == keys[pending])
+            self._values[current[same]] = values[pending[same]]
+
+            empty = np.flatnonzero(~occupied)
+            _, first = np.unique(current[empty], return_index=True)
+            winners = empty[first]
+            target = current[winners]
+            self._occupied[target] = True
+            self._keys[target] = keys[pending[winners]]
+            self._values[target] = values[pending[winners]]
+            self._count += winners.size
+
+            done = same
+            done[winners] = True
+            # Losers of a claim stay put: next pass their slot is taken and they move on.
+            move = occupied & ~same
+            slots[pending[move]] = (current[move] + 1) & self._mask
+            pending = pending[~done]
+
+    def _resize(self, size):
+        keys = self._keys[self._occupied]
+        values = self._values[self._occupied]
+        self._allocate(size)
+        self._count = 0
+        self._insert(keys, values)
+
+    def put(self, key, value):
+        """
+            Add a single key-value pair.
+        """
+        self.put_batch(np.array([key], dtype=np.int64), np.array([value], dtype=self._value_dtype))
+
+    def get(self, key, default=0):
+        """
+            Return the value for a single key.
+        """
+        return self.get_batch(np.array([key], dtype=np.int64), default)[0]
+
+    def contains_batch(self, keys):
+        """
+            :return: boolean array, True where the key is in the table.
+        """
+        keys = np.ascontiguousarray(keys, dtype=np.int64)
+        result = np.zeros(keys.shape[0], dtype=bool)
+
+        slots = self._home(keys)
+        pending = np.arange(keys.shape[0])
+
+        while pending.size:
+            current = slots[pending]
+            occupied = self._occupied[current]
+            found = occupied & (self._keys[current] == keys[pending])
+            result[pending[found]] = True
+
+            go_on = occupied & ~found
+            pending = pending[go_on]
+            slots[pending] = (current[go_on] + 1) & self._mask
+
+        return result
+
+    def items(self):
+        """
+            :return: (keys, values) arrays of all entries, in slot order.
+        """
+        return self._keys[self._occupied].copy(), self._values[self._occupied].copy()
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __contains__(self, key):
+        return bool(self.contains_batch(np.array([key], dtype=np.int64))[0])
+
+    def __len__(self):
+        return self._count
+
+
+if __name__ == "__main__":
+    from timeit import default_timer as timer
+    from hashTableInplementation import HashTable
+
+    n = 10 ** 6
+    rng = np.random.default_rng(42)
+    keys = rng.integers(-2 ** 62, 2 ** 62, size=n, dtype=np.int64)
+    values = np.arange(n, dtype=np.int64)
+
+    start = timer()
+    vectorized = Int64HashTable(capacity=n)
+    vectorized.put_batch(keys, values)
+    looked_up = vectorized.get_batch(keys, default=-1)
+    print("Int64HashTable batch put+get: {:.3f}s".format(timer() - start), bool((looked_up == values).all()))
+
+    start = timer()
+    per_key = HashTable.from_items(zip(keys.tolist(), values.tolist()), expected_size=n)
+    for key in keys.tolist():
+        per_key.get(key)
+    print("HashTable per-key put+get:    {:.3f}s".format(timer() - start))
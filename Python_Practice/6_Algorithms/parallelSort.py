@@ -0,0 +1,118 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+'''
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+MIN_RUN = 1 << 16           # Below this many items per worker one np.sort is faster.
+
+_attached = {}              # Shared memory blocks a worker has opened, by name.
+
+
+def _view(name, dtype, size):
+    block = _attached.get(name)
+    if block is None:
+        block = _attached[name] = shared_memory.SharedMemory(name=name)
+    return np.ndarray((size,), dtype=dtype, buffer=block.buf)
+
+
+def _sort_run(task):
+    ''' worker: sort items start..stop of the shared array in place '''
+    name, dtype, size, start, stop = task
+    _view(name, dtype, size)[start:stop].sort()
+
+
+def _merge_part(task):
+    ''' worker: merge src[a0:a1] and src[b0:b1] (both sorted) into dst from out '''
+    src_name, dst_name, dtype, size, a0, a1, b0, b1, out = task
+    src = _view(src_name, dtype, size)
+    dst = _view(dst_name, dtype, size)
+    a, b = src[a0:a1], src[b0:b1]
+    # Each item's place in the output is its place in its own run plus the
+    # number of items of the other run that go before it (ties: a first).
+    dst[out + np.arange(len(a)) + np.searchsorted(b, a, side="left")] = a
+    dst[out + np.arange(len(b)) + np.searchsorted(a, b, side="right")] = b
+
+
+def _merge_tasks(src, dst, view, dtype, size, runs, pieces):
+    ''' tasks that merge neighbouring runs of src (view is its array) in pairs,
+        each pair cut into pieces that can be merged independently (merge
+        path: a cut at a[i] in the first run matches the cut at
+        searchsorted(b, a[i]) in the second)
+        runs is a list of (start, stop); returns the tasks and the new runs
+    '''
+    tasks, merged = [], []
+    for k in range(0, len(runs), 2):
+        if k + 1 == len(runs):
+            # Odd one out: copied across as it is.
+            start, stop = runs[k]
+            tasks.append((src, dst, dtype, size, start, stop, stop, stop, start))
+            merged.append(runs[k])
+            continue
+
+        (a0, a1), (b0, b1) = runs[k], runs[k + 1]
+        a_cuts = [a0 + (a1 - a0) * i // pieces for i in range(pieces + 1)]
+        b_cuts = [b0] + [b0 + int(np.searchsorted(view[b0:b1], view[cut], side="left"))
+                         for cut in a_cuts[1:-1]] + [b1]
+        for i in range(pieces):
+            tasks.append((src, dst, dtype, size, a_cuts[i], a_cuts[i + 1], b_cuts[i], b_cuts[i + 1],
+                          a_cuts[i] + b_cuts[i] - b0))
+        merged.append((a0, b1))
+    return tasks, merged
+
+
+def parallel_sort(values, workers=None):
+    """
+        Sorted copy of values (a NumPy array or a sequence of numbers), as a NumPy array.
+
+        The data is copied once into shared memory and the workers get
+        only its name and index ranges, so no array is ever pickled:
+            1. the array is cut into one run per worker and each run is
+               sorted in place by np.sort in its own process
+            2. runs are merged in pairs, round after round, into a second
+               shared buffer and back (a merge tree); every merge is cut
+               into pieces so all workers stay busy even in the last round
+        Object arrays (e.g. Python ints past int64) are sorted by np.sort in
+        this process: their items are pointers, meaningless in another one.
+    """
+    array = np.asarray(values)
+    if array.ndim != 1:
+        raise ValueError("parallel_sort sorts one-dimensional arrays")
+    workers = workers or os.cpu_count() or 1
+    size = len(array)
+    if workers == 1 or size < workers * MIN_RUN or array.dtype.hasobject:
+        return np.sort(array)
+
+    dtype = array.dtype.str
+    blocks = [shared_memory.SharedMemory(create=True, size=array.nbytes) for _ in range(2)]
+    views = {block.name: np.ndarray((size,), dtype=array.dtype, buffer=block.buf) for block in blocks}
+    try:
+        src, dst = blocks[0].name, blocks[1].name
+        views[src][:] = array
+
+        runs = [(size * i // workers, size * (i + 1) // workers) for i in range(workers)]
+        with Pool(workers) as pool:
+            pool.map(_sort_run, [(src, dtype, size, start, stop) for start, stop in runs])
+            while len(runs) > 1:
+                pieces = max(1, workers // (len(runs) // 2))
+                tasks, runs = _merge_tasks(src, dst, views[src], dtype, size, runs, pieces)
+                pool.map(_merge_part, tasks)
+                src, dst = dst, src
+
+        return views[src].copy()
+    finally:
+        # The arrays must let go of the buffers before the blocks can be closed.
+        views.clear()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    data = np.random.default_rng(1).integers(0, 10 ** 9, size=2 * 10 ** 6)
+    result = parallel_sort(data, workers=4)
+    print(result[:5], bool(np.array_equal(result, np.sort(data))))
@@ -0,0 +1,48 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+parallel_sort on 1 to N worker processes against the single core
+quicksort from quickSort1.py (the same function as sorting.quicksort,
+which cannot be imported without pandas). Random 64-bit integers;
+quicksort gets them as a list, parallel_sort as a NumPy array.
+'''
+import contextlib
+import os
+import sys
+from timeit import default_timer as timer
+
+import numpy as np
+
+from parallelSort import parallel_sort
+
+with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+    # quickSort1 prints its example and timings when it is imported.
+    from quickSort1 import quicksort
+
+
+if __name__ == "__main__":
+    # Optional arguments: number of items and most workers, e.g. "python parallelSortBenchmark.py 10000000 8".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    most = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    data = np.random.default_rng(1).integers(0, 2 ** 62, size=n)
+    expected = np.sort(data)
+
+    values = data.tolist()
+    start = timer()
+    quick = quicksort(values)
+    base = timer() - start
+    assert quick == expected.tolist()
+    print("{} items, quicksort {:.2f}s".format(n, base))
+
+    print("{:>8} {:>9} {:>15} {:>14}".format("workers", "time s", "vs quicksort", "vs 1 worker"))
+    single = None
+    for workers in range(1, most + 1):
+        start = timer()
+        result = parallel_sort(data, workers)
+        elapsed = timer() - start
+        assert np.array_equal(result, expected)
+        single = single or elapsed
+        print("{:>8} {:>9.3f} {:>14.1f}x {:>13.2f}x".format(workers, elapsed, base / elapsed, single / elapsed))
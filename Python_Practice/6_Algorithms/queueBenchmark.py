@@ -0,0 +1,71 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Compares the ring buffer Queue from queuePractice with the old list based
+Queue (dequeue via list.pop(0)). Fill a queue with N items then drain it.
+'''
+import sys
+from timeit import default_timer as timer
+
+from queuePractice import Queue
+
+
+class ListQueue:
+    """
+        The previous Queue implementation: list.append / list.pop(0).
+        Kept here only as the baseline for the benchmark.
+    """
+
+    def __init__(self):
+        self._data = []
+
+    def isEmpty(self):
+        return len(self._data) == 0
+
+    def enqueue(self, item):
+        self._data.append(item)
+
+    def dequeue(self):
+        return self._data.pop(0)
+
+    def size(self):
+        return len(self._data)
+
+
+# pop(0) is O(N) so draining the list queue is O(N^2); above this size it takes hours.
+LIST_LIMIT = 10 ** 5
+
+
+def fill_and_drain(queue, n):
+    start = timer()
+    for i in range(n):
+        queue.enqueue(i)
+    while not queue.isEmpty():
+        queue.dequeue()
+    return timer() - start
+
+
+def fill_and_drain_batched(queue, n, batch=1000):
+    start = timer()
+    for i in range(0, n, batch):
+        queue.enqueue_many(range(i, min(i + batch, n)))
+    while not queue.isEmpty():
+        queue.dequeue_many(batch)
+    return timer() - start
+
+
+if __name__ == "__main__":
+    # Optional argument: largest power of ten to run, e.g. "python queueBenchmark.py 6".
+    max_exp = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print("{:>10} {:>12} {:>12} {:>14}".format("N", "list [s]", "ring [s]", "ring batch [s]"))
+    for exp in range(3, max_exp + 1):
+        n = 10 ** exp
+        list_time = fill_and_drain(ListQueue(), n) if n <= LIST_LIMIT else None
+        ring_time = fill_and_drain(Queue(), n)
+        batch_time = fill_and_drain_batched(Queue(), n)
+
+        print("{:>10} {:>12} {:>12.4f} {:>14.4f}".format(
+            n, "skipped" if list_time is None else "{:.4f}".format(list_time), ring_time, batch_time))
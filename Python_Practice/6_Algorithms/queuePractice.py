@@ -3,42 +3,110 @@ Created on 21 Dec 2019
 
 @author: M.Laptop
 '''
+import threading
+from time import monotonic
+
+
 class EmptyQueueError(Exception):
     """
         Custom Error for empty queue.
     """
     pass
 
+class QueueFullError(Exception):
+    """
+        Custom Error for a bounded queue that has no free slots.
+    """
+    pass
+
 class Queue:
     """
         Queue: FIFO Data Structure.
         Operations:
             enqueue(item)
+            enqueue_many(items)
             dequeue()
+            dequeue_many(n)
             isEmpty()
             size()
     """
 
-    def __init__(self):
+    _MIN_CAPACITY = 8
+
+    def __init__(self, maxsize=0, block=False):
         """
             Define an empty queue.
-            Here we are using list to implement the Queue data structure.
+            Items are kept in a circular buffer (ring buffer) so both ends
+            are O(1): _head points at the front item and the rear is found
+            from _head + _count. The capacity is always a power of two,
+            which lets us wrap indices with a bit mask instead of modulo.
+            :param maxsize: maximum number of items, 0 means unbounded.
+            :param block: if True a full queue makes enqueue wait for a
+                          dequeue, otherwise it raises QueueFullError.
         """
-        self._data = []
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+
+        self._maxsize = maxsize
+        self._block = block
+        self._data = [None] * self._MIN_CAPACITY
+        self._mask = self._MIN_CAPACITY - 1
+        self._head = 0          #Index of the front item.
+        self._count = 0         #Number of items in the queue.
+
+        # Only a bounded queue needs the condition, the unbounded one never waits.
+        self._not_full = threading.Condition() if maxsize else None
 
     def isEmpty(self):
         """
             Test if the queue has no items.
             :return: True if Queue is Empty. False Otherwise
         """
-        return self.size() == 0
+        return self._count == 0
 
-    def enqueue(self, item):
+    def isFull(self):
+        """
+            Test if a bounded queue has reached maxsize.
+            :return: True if no more items can be added. Always False if unbounded.
+        """
+        return 0 < self._maxsize <= self._count
+
+    def enqueue(self, item, timeout=None):
         """
             Insert the item at the rear of the Queue
             :param item: item to be added on to the Queue
+            :param timeout: seconds to wait for a free slot when blocking, None waits forever.
+            :raises: QueueFullError if the bounded Queue is full (after timeout when blocking).
         """
-        self._data.append(item)
+        if self._not_full is None:
+            self._put(item)
+            return
+
+        with self._not_full:
+            self._wait_for_room(1, timeout)
+            self._put(item)
+
+    def enqueue_many(self, items, timeout=None):
+        """
+            Insert all items at the rear of the Queue keeping their order.
+            On a bounded queue the batch is added only when it fits as a whole.
+            :param items: iterable of items to be added on to the Queue
+            :param timeout: seconds to wait for free slots when blocking, None waits forever.
+            :raises: QueueFullError if the batch does not fit into the bounded Queue.
+        """
+        items = list(items)
+
+        if self._not_full is None:
+            self._put_many(items)
+            return
+
+        if len(items) > self._maxsize:
+            raise QueueFullError("Batch of {} items can never fit into a Queue of maxsize {}."
+                                 .format(len(items), self._maxsize))
+
+        with self._not_full:
+            self._wait_for_room(len(items), timeout)
+            self._put_many(items)
 
     def dequeue(self):
         """
@@ -46,17 +114,130 @@ class Queue:
             :return: item removed from the front of the Queue.
             :raises: EmptyQueueError if Queue has no elements.
         """
-        if self.isEmpty():
-            raise EmptyQueueError("Trying to dequeue from an Empty Queue.")
+        if self._not_full is None:
+            return self._get()
 
-        return self._data.pop(0)
+        with self._not_full:
+            item = self._get()
+            # Wake every waiter: the oldest may be a batch that still does not fit
+            # while a smaller enqueue behind it would, and notify() would stop there.
+            self._not_full.notify_all()
+            return item
+
+    def dequeue_many(self, n):
+        """
+            Removes up to n items from the front of the Queue.
+            :param n: maximum number of items to remove.
+            :return: list of removed items in FIFO order (shorter than n if the Queue runs out).
+        """
+        if n < 0:
+            raise ValueError("n must be >= 0")
+
+        if self._not_full is None:
+            return self._get_many(n)
+
+        with self._not_full:
+            items = self._get_many(n)
+            if items:
+                self._not_full.notify_all()
+            return items
 
     def size(self):
         """
             Returns the number of elements currently in the Queue.
             :return: size of the Queue.
         """
-        return len(self._data)
+        return self._count
+
+    def __len__(self):
+        return self._count
+
+    def _wait_for_room(self, n, timeout):
+        """
+            Wait (or fail straight away) until n more items fit. Caller holds _not_full.
+        """
+        if self._count + n <= self._maxsize:
+            return
+
+        if not self._block:
+            raise QueueFullError("Trying to enqueue into a full Queue.")
+
+        deadline = None if timeout is None else monotonic() + timeout
+        while self._count + n > self._maxsize:
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                raise QueueFullError("Timed out waiting for a free slot in the Queue.")
+            self._not_full.wait(remaining)
+
+    def _put(self, item):
+        if self._count == len(self._data):
+            self._resize(len(self._data) * 2)
+
+        self._data[(self._head + self._count) & self._mask] = item
+        self._count += 1
+
+    def _put_many(self, items):
+        needed = self._count + len(items)
+        if needed > len(self._data):
+            capacity = len(self._data)
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+        # Copy the batch in at most two slices: up to the end of the buffer, then from index 0.
+        capacity = len(self._data)
+        start = (self._head + self._count) & self._mask
+        first = min(len(items), capacity - start)
+        self._data[start:start + first] = items[:first]
+        self._data[:len(items) - first] = items[first:]
+        self._count = needed
+
+    def _get(self):
+        if self._count == 0:
+            raise EmptyQueueError("Trying to dequeue from an Empty Queue.")
+
+        item = self._data[self._head]
+        self._data[self._head] = None       # Drop the reference so the item can be collected.
+        self._head = (self._head + 1) & self._mask
+        self._count -= 1
+
+        self._shrink_if_sparse()
+        return item
+
+    def _get_many(self, n):
+        n = min(n, self._count)
+        capacity = len(self._data)
+        first = min(n, capacity - self._head)
+
+        items = self._data[self._head:self._head + first]
+        self._data[self._head:self._head + first] = [None] * first
+        if n > first:
+            items += self._data[:n - first]
+            self._data[:n - first] = [None] * (n - first)
+
+        self._head = (self._head + n) & self._mask
+        self._count -= n
+
+        self._shrink_if_sparse()
+        return items
+
+    def _shrink_if_sparse(self):
+        # Give memory back once a drained backlog uses less than a quarter of the buffer.
+        capacity = len(self._data)
+        if capacity > self._MIN_CAPACITY and self._count < capacity // 4:
+            self._resize(max(capacity // 2, self._MIN_CAPACITY))
+
+    def _resize(self, capacity):
+        """
+            Copy the items, front first, into a new buffer of the given capacity.
+        """
+        old = self._data
+        tail = min(self._count, len(old) - self._head)
+        items = old[self._head:self._head + tail] + old[:self._count - tail]
+
+        self._data = items + [None] * (capacity - self._count)
+        self._mask = capacity - 1
+        self._head = 0
 
 
 if __name__ == "__main__":
@@ -70,26 +251,45 @@ if __name__ == "__main__":
     while not q.isEmpty():
         print(q.dequeue())
 
+    q.enqueue_many(range(10))
+    print(q.dequeue_many(4), q.dequeue_many(100))
+
+    bounded = Queue(maxsize=2)
+    bounded.enqueue_many(["a", "b"])
+    try:
+        bounded.enqueue("c")
+    except QueueFullError as error:
+        print(error)
+
     import time
 
+    # A batch that still does not fit must not swallow the wakeup of a single enqueue that does.
+    full = Queue(maxsize=5, block=True)
+    full.enqueue_many(range(5))
+    results = []
+
+    def waiting_batch():
+        try:
+            full.enqueue_many(range(5), timeout=0.5)
+        except QueueFullError:
+            results.append("batch timed out")
+
+    def waiting_single():
+        full.enqueue("x")
+        results.append("single enqueued")
+
+    batch = threading.Thread(target=waiting_batch)
+    batch.start()
+    time.sleep(0.1)
+    single = threading.Thread(target=waiting_single, daemon=True)
+    single.start()
+    time.sleep(0.1)
+    full.dequeue()
+    batch.join()
+    single.join(1)
+    print(results, "single still blocked" if single.is_alive() else full.size())
+
     time.sleep(1)  # To ensure the output from program and exception is not interleaved.
 
     # Try to dequeue from empty queue.
     #q.dequeue()
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
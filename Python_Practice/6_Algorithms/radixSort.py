@@ -0,0 +1,215 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Counting sort and LSD radix sort for integer keys (lists, array('q') and
+friends, NumPy int arrays) and fixed-width bytes keys, with NumPy doing
+every pass over the data.
+
+radix_argsort sorts on one digit per pass, least significant first.
+A pass takes the histogram of the digit (np.bincount) and skips the
+digit when every key has the same value there; otherwise the keys are
+reordered by a stable sort of the digit array alone, which NumPy runs as
+a counting sort in C for uint8/uint16 digits. Stability of every pass is
+what makes the whole sort stable, so the indices can be used as a
+stable argsort.
+
+Digit width is picked automatically: 16-bit digits once there are at
+least 2**16 keys (fewer passes, the 65536 bucket histogram is cheap next
+to the data), 8-bit digits below that. Integer keys are first shifted so
+the smallest is 0, so keys that fit in 20 bits take two passes whatever
+their dtype.
+'''
+from array import array
+
+import numpy as np
+
+_SIGN = np.uint64(1 << 63)
+
+
+def _digit_bits(n):
+    return 16 if n >= 1 << 16 else 8
+
+
+def _as_numpy(values):
+    ''' NumPy view of values, without copying an array('q') or an ndarray '''
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=np.dtype(values.typecode)) if len(values) else np.zeros(0, np.int64)
+    data = np.asarray(values)
+    if data.dtype.kind in "fO" and all(isinstance(value, int) for value in values):
+        # Python ints above the int64 range: NumPy would make them floats.
+        data = np.asarray(values, dtype=np.uint64)
+    return data
+
+
+def _unsigned_keys(values):
+    ''' (keys, offset): uint64 keys - offset in the same order as values, smallest 0 '''
+    if values.dtype.kind == "u":
+        keys = values.astype(np.uint64)
+    elif values.dtype.kind in "ib":
+        # Flipping the sign bit maps int64 order onto uint64 order.
+        keys = values.astype(np.int64).view(np.uint64) ^ _SIGN
+    else:
+        raise TypeError("radix sort needs integer keys, got {}".format(values.dtype))
+    offset = keys.min()
+    return keys - offset, offset
+
+
+def _from_unsigned(keys, offset, dtype):
+    keys = keys + offset
+    if dtype.kind != "u":
+        keys = (keys ^ _SIGN).view(np.int64)
+    return keys.astype(dtype)
+
+
+def _stable_pass(digits, n):
+    ''' order that sorts the digit array stably, None when every key has the same digit '''
+    if np.bincount(digits).max() == n:
+        return None
+    return np.argsort(digits, kind="stable")
+
+
+def _int_passes(values, with_order):
+    ''' (sorted uint64 keys, offset, order or None) for integer values '''
+    n = len(values)
+    keys, offset = _unsigned_keys(values)
+    order = np.arange(n) if with_order else None
+    bits = _digit_bits(n)
+    digit_type = np.uint16 if bits == 16 else np.uint8
+    mask = np.uint64((1 << bits) - 1)
+    for shift in range(0, int(keys.max()).bit_length(), bits):
+        step = _stable_pass(((keys >> np.uint64(shift)) & mask).astype(digit_type), n)
+        if step is not None:
+            keys = keys[step]
+            if with_order:
+                order = order[step]
+    return keys, offset, order
+
+
+def _int_argsort(values):
+    if len(values) < 2:
+        return np.arange(len(values))
+    return _int_passes(values, True)[2]
+
+
+def _bytes_matrix(keys):
+    ''' (n, width) uint8 matrix of fixed-width bytes keys (a list of bytes or a NumPy "S" array) '''
+    if isinstance(keys, np.ndarray):
+        width = keys.dtype.itemsize
+        return np.ascontiguousarray(keys).view(np.uint8).reshape(len(keys), width)
+    width = len(keys[0]) if keys else 0
+    if any(len(key) != width for key in keys):
+        raise ValueError("bytes keys must all have the same length")
+    return np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(len(keys), width)
+
+
+def _bytes_argsort(keys):
+    matrix = _bytes_matrix(keys)
+    n, width = matrix.shape
+    order = np.arange(n)
+    if n < 2:
+        return order
+
+    # Byte pairs as one 16-bit digit (big-endian), from the last pair to the first.
+    # Digits are gathered in the current order, so the keys themselves never move.
+    digit_width = 2 if _digit_bits(n) == 16 else 1
+    column = width
+    while column > 0:
+        start = max(0, column - digit_width)
+        part = matrix[order, start:column].astype(np.uint16)
+        digits = part[:, 0] if part.shape[1] == 1 else (part[:, 0] << 8) | part[:, 1]
+        step = _stable_pass(digits, n)
+        if step is not None:
+            order = order[step]
+        column = start
+    return order
+
+
+def _is_bytes_keys(values):
+    if isinstance(values, np.ndarray):
+        return values.dtype.kind == "S"
+    return isinstance(values, (list, tuple)) and bool(values) and isinstance(values[0], bytes)
+
+
+def radix_argsort(values):
+    """
+        Stable argsort (indices that sort values, equal keys keep their order) as a NumPy array.
+        values: integers (list, array('q') or similar, NumPy int array) or
+        fixed-width bytes (list of bytes of one length, NumPy "S" array).
+    """
+    if _is_bytes_keys(values):
+        return _bytes_argsort(values)
+    return _int_argsort(_as_numpy(values))
+
+
+def radix_sort(values):
+    ''' sorted copy of values; an array('q') gives an array, a list a list, a NumPy array a NumPy array '''
+    if _is_bytes_keys(values):
+        order = _bytes_argsort(values)
+        if isinstance(values, np.ndarray):
+            return values[order]
+        return [values[i] for i in order.tolist()]
+
+    data = _as_numpy(values)
+    result = _radix_sort_ints(data)
+    return _like(values, result)
+
+
+def _radix_sort_ints(data):
+    ''' sorted int array; only the keys move, no index array '''
+    if len(data) < 2:
+        return data.copy()
+    keys, offset, _ = _int_passes(data, False)
+    return _from_unsigned(keys, offset, data.dtype)
+
+
+def _like(values, result):
+    if isinstance(values, array):
+        return array(values.typecode, result.tobytes())
+    if isinstance(values, np.ndarray):
+        return result
+    return result.tolist()
+
+
+def counting_sort(values, max_range=None):
+    """
+        Sorted copy of integer values by counting: one histogram (np.bincount)
+        and one np.repeat, O(n + range). Only for keys in a small range:
+        raises ValueError when max - min is above max_range (by default
+        max(2**16, 4 * n)); radix_sort handles any range.
+    """
+    data = _as_numpy(values)
+    if len(data) < 2:
+        return _like(values, data.copy())
+    if data.dtype.kind not in "iub":
+        raise TypeError("counting sort needs integer keys, got {}".format(data.dtype))
+
+    lo, hi = int(data.min()), int(data.max())
+    limit = max_range if max_range is not None else max(1 << 16, 4 * len(data))
+    if hi - lo > limit:
+        raise ValueError("key range {} is too wide for counting sort, use radix_sort".format(hi - lo))
+
+    # Offsets from the minimum, computed so that neither int8 nor uint64 keys overflow.
+    low = data.min()
+    if data.dtype.kind == "u":
+        offsets = (data - low).astype(np.int64)
+        values_of = np.arange(hi - lo + 1, dtype=np.uint64) + np.uint64(low)
+    else:
+        offsets = data.astype(np.int64) - lo
+        values_of = np.arange(lo, hi + 1, dtype=np.int64)
+    counts = np.bincount(offsets, minlength=hi - lo + 1)
+    result = np.repeat(values_of, counts).astype(data.dtype)
+    return _like(values, result)
+
+
+if __name__ == "__main__":
+    print(radix_sort([10, 5, -2, 3, 6, 3, 10, 5, -2, 3, 6, 3]))
+    print(radix_sort(array("q", [2 ** 62, -(2 ** 62), 0, 7])))
+    print(counting_sort([3, 1, 2, 3, 1, 0]))
+
+    names = [b"Marina", b"Wiesia", b"Frania", b"Ziutaa", b"Marena"]
+    print(radix_sort(names), radix_argsort(names))
+
+    scores = np.array([3, 1, 3, 2, 1])
+    print(radix_argsort(scores), np.argsort(scores, kind="stable"))
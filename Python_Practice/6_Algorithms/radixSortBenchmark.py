@@ -0,0 +1,65 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+radix_sort and counting_sort against quickSort1.quicksort, the built-in
+sorted and np.sort, on bounded integers, full 64-bit integers and
+fixed-width bytes keys. Python sorts get a list, the NumPy ones an array
+(the list -> array conversion is not timed). "-" means not applicable,
+"recursion" that quicksort hit the recursion limit: every duplicate of
+the pivot goes into "less", so many equal keys make it recurse once per
+duplicate.
+'''
+import contextlib
+import os
+import random
+import sys
+from timeit import default_timer as timer
+
+import numpy as np
+
+from radixSort import counting_sort, radix_sort
+
+with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+    # quickSort1 prints its example and timings when it is imported.
+    from quickSort1 import quicksort
+
+
+def inputs(n):
+    rng = np.random.default_rng(1)
+    rnd = random.Random(1)
+    yield "ints < 1000", rng.integers(0, 1000, size=n)
+    yield "ints < 2**20", rng.integers(0, 1 << 20, size=n)
+    yield "int64", rng.integers(-(2 ** 63), 2 ** 63 - 1, size=n)
+    yield "8-byte keys", [rnd.getrandbits(64).to_bytes(8, "big") for _ in range(n)]
+
+
+def timed(fn, data):
+    start = timer()
+    try:
+        fn(data)
+    except RecursionError:
+        return "recursion"
+    return timer() - start
+
+
+if __name__ == "__main__":
+    # Optional argument: number of keys, e.g. "python radixSortBenchmark.py 100000".
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{} keys, seconds".format(n))
+    print("{:>14} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+        "", "quicksort", "sorted", "np.sort", "radix", "counting"))
+
+    for label, data in inputs(n):
+        values = data if isinstance(data, list) else data.tolist()
+        array_data = np.array(data, dtype="S8") if isinstance(data, list) else data
+        cells = [timed(quicksort, values), timed(sorted, values), timed(np.sort, array_data),
+                 timed(radix_sort, array_data)]
+        if not isinstance(data, list) and int(data.max()) - int(data.min()) <= 4 * n:
+            cells.append(timed(counting_sort, data))
+        else:
+            cells.append(None)
+        print("{:>14}".format(label) + "".join(
+            "{:>11}".format("-" if cell is None else cell if isinstance(cell, str) else "{:.3f}".format(cell))
+            for cell in cells))
@@ -0,0 +1,211 @@
+'''
+Created on 18 Oct 2026
+
+@author: M.Laptop
+
+Selection instead of sorting, for when only the max, the k-th smallest,
+the median or the top k are needed:
+
+    nth_element(array, k)     - introselect, O(n), in place
+    median(data)
+    percentiles(data, ps)     - all ps with one multi-way select
+    top_k(iterable, k, key)   - bounded heap, O(k) memory, streams
+    min_max(iterable), argmin(iterable), argmax(iterable) - one pass
+
+nth_element is quickselect with the pivots and three-way partition of
+introSort; if a range is split more than 2 * log2(n) times it is
+finished by heapsort, so a bad pivot sequence costs O(n log n) at most,
+never O(n**2).
+'''
+import heapq
+from itertools import islice
+
+from introSort import SMALL, _heapsort, _insertion_sort, _partition3, _pivot, _with_key
+
+
+def _select(array, ranks, lo, hi):
+    ''' put array[r] in its sorted place for every r in ranks (sorted, all in lo..hi) '''
+    stack = [(lo, hi, ranks, 2 * max(1, hi - lo + 1).bit_length())]
+    while stack:
+        lo, hi, ranks, depth = stack.pop()
+        if hi - lo < SMALL:
+            _insertion_sort(array, lo, hi)
+            continue
+        if depth == 0:
+            _heapsort(array, lo, hi)
+            continue
+        lt, gt = _partition3(array, lo, hi, _pivot(array, lo, hi))
+        # Ranks inside lt..gt are done: that block holds the pivot's equals.
+        left = [r for r in ranks if r < lt]
+        right = [r for r in ranks if r > gt]
+        if left:
+            stack.append((lo, lt - 1, left, depth - 1))
+        if right:
+            stack.append((gt + 1, hi, right, depth - 1))
+
+
+def nth_element(array, k, key=None):
+    ''' rearrange array in place so array[k] is the item a full sort would put
+        there, with nothing bigger before it and nothing smaller after it;
+        returns array[k]. Negative k counts from the end.
+        key= works like introsort's: on an error the list is left unchanged.
+    '''
+    n = len(array)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("nth_element index out of range")
+
+    if key is not None:
+        _with_key(array, key, lambda entries: _select(entries, [k], 0, n - 1))
+        return array[k]
+
+    _select(array, [k], 0, n - 1)
+    return array[k]
+
+
+def median(data):
+    ''' median of the numbers in data (any iterable), the mean of the two middle ones for an even count '''
+    values = list(data)
+    n = len(values)
+    if n == 0:
+        raise ValueError("median of no data")
+    upper = nth_element(values, n // 2)
+    if n % 2:
+        return upper
+    # Everything before n // 2 is no bigger, so the lower middle is their max.
+    return (max(islice(values, n // 2)) + upper) / 2
+
+
+def percentiles(data, ps):
+    ''' the ps-th percentiles (0..100) of the numbers in data, with linear
+        interpolation between neighbours (numpy.percentile's default);
+        every rank needed is found by one multi-way select
+    '''
+    values = list(data)
+    n = len(values)
+    if n == 0:
+        raise ValueError("percentiles of no data")
+    for p in ps:
+        if not 0 <= p <= 100:
+            raise ValueError("percentiles must be between 0 and 100, got {}".format(p))
+
+    positions = [p / 100 * (n - 1) for p in ps]
+    ranks = sorted({int(position) for position in positions} |
+                   {min(int(position) + 1, n - 1) for position in positions})
+    _select(values, ranks, 0, n - 1)
+
+    result = []
+    for position in positions:
+        below = int(position)
+        above = min(below + 1, n - 1)
+        fraction = position - below
+        result.append(values[below] + (values[above] - values[below]) * fraction if fraction else values[below])
+    return result
+
+
+class _Reversed:
+    ''' key wrapper that turns the min-heap upside down, for top_k(largest=False) '''
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def top_k(iterable, k, key=None, largest=True):
+    ''' the k largest (or smallest) items, best first; equal keys keep the order they came in.
+        Keeps a heap of the k best seen so far, whose root is the worst of
+        them: O(k) memory and O(log k) work only for items that beat the root.
+    '''
+    if k <= 0:
+        return []
+
+    heap = []
+    for index, item in enumerate(iterable):
+        value = item if key is None else key(item)
+        if not largest:
+            value = _Reversed(value)
+        # (value, -index): among equal values the latest item is the worst one.
+        entry = (value, -index, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif heap[0] < entry:
+            heapq.heapreplace(heap, entry)
+
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
+
+
+def min_max(iterable, key=None):
+    ''' (smallest, largest) in one pass, about 3 comparisons per 2 items instead of 4;
+        raises ValueError for an empty iterable, the first of equal items wins
+    '''
+    items = iter(iterable)
+    try:
+        first = next(items)
+    except StopIteration:
+        raise ValueError("min_max() arg is an empty sequence") from None
+    key = key or (lambda item: item)
+
+    low = high = first
+    low_key = high_key = key(first)
+    for a in items:
+        a_key = key(a)
+        b = next(items, items)
+        if b is items:
+            # Odd one out at the end.
+            if a_key < low_key:
+                low, low_key = a, a_key
+            elif high_key < a_key:
+                high, high_key = a, a_key
+            break
+        b_key = key(b)
+        # Order the pair first, then the smaller one only races low and the bigger high.
+        if b_key < a_key:
+            if b_key < low_key:
+                low, low_key = b, b_key
+            if high_key < a_key:
+                high, high_key = a, a_key
+        else:
+            if a_key < low_key:
+                low, low_key = a, a_key
+            if high_key < b_key:
+                # On a tie the earlier item of the pair is the first largest.
+                high, high_key = (b, b_key) if a_key < b_key else (a, a_key)
+    return low, high
+
+
+def argmin(iterable, key=None):
+    ''' index of the first smallest item '''
+    return min(enumerate(iterable), key=lambda pair: pair[1] if key is None else key(pair[1]))[0]
+
+
+def argmax(iterable, key=None):
+    ''' index of the first largest item '''
+    return max(enumerate(iterable), key=lambda pair: pair[1] if key is None else key(pair[1]))[0]
+
+
+if __name__ == "__main__":
+    import random
+    from timeit import default_timer as timer
+
+    data = [2, 4, 5, 2, 15, 6, 4, 6, 8]
+    print(min_max(data), argmax(data), argmin(data))
+    print(nth_element(list(data), 3), median(data), percentiles(data, [25, 50, 90]))
+    print(top_k(["Marina", "Wiesia", "Frania", "Ziuta", "Marek"], 2, key=len))
+
+    n = 1000000
+    values = [random.random() for _ in range(n)]
+    for label, fn in (("sorted()[n // 2]", lambda: sorted(values)[n // 2]),
+                      ("median", lambda: median(values)),
+                      ("top_k(10)", lambda: top_k(values, 10)),
+                      ("min_max", lambda: min_max(values))):
+        start = timer()
+        fn()
+        print("{:>16}: {:.3f}s".format(label, timer() - start))